@@ -1,9 +1,92 @@
 import sys
+import argparse
 import logging
-from simulator.application import Application
-from PyQt6.QtWidgets import QApplication
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Factory Material Flow Simulator")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run the simulation without the GUI as fast as possible")
+    parser.add_argument("--until", type=float, default=3600.0,
+                        help="Headless: sim time to run until (default: 3600)")
+    parser.add_argument("--db", default=None,
+                        help="Headless: SQLAlchemy URL to persist the run into (default: no persistence)")
+    parser.add_argument("--db-writer-thread", action="store_true",
+                        help="Headless: persist on a background writer thread (file database only)")
+    parser.add_argument("--refill", action="append", default=[], metavar="ITEM:QTY",
+                        help="Headless: place a refill order at start. Repeatable")
+    parser.add_argument("--opm", action="append", default=[], metavar="ITEM:QTY[,ITEM:QTY]",
+                        help="Headless: place an opm order at start. Repeatable")
+    parser.add_argument("--record", default=None, metavar="PATH",
+                        help="Headless: record every event of the run into a replayable log")
+    parser.add_argument("--replay", default=None, metavar="PATH",
+                        help="Replay a recorded log in the GUI, or with --headless --db rebuild its database")
+    return parser.parse_args(argv)
+
+def _parse_order_lines(spec: str) -> dict[int, int]:
+    """Parse 'ITEM:QTY,ITEM:QTY' into an item quantity dict."""
+    lines = {}
+    for line in spec.split(","):
+        item_id, qty = line.split(":")
+        lines[int(item_id)] = lines.get(int(item_id), 0) + int(qty)
+    return lines
+
+def run_headless(args: argparse.Namespace) -> int:
+    # Imported here so that the GUI stack is never loaded for headless runs
+    from simulator.headless import HeadlessSimulation
+
+    if args.replay is not None:
+        return run_headless_replay(args)
+
+    simulation = HeadlessSimulation(db_url=args.db, background_writer=args.db_writer_thread,
+                                    record_path=args.record)
+    for spec in args.refill:
+        for item_id, qty in _parse_order_lines(spec).items():
+            simulation.inventory_manager.place_refill_order(item_id, qty)
+    for spec in args.opm:
+        simulation.inventory_manager.place_opm_order(_parse_order_lines(spec))
+
+    result = simulation.run(until=args.until)
+    simulation.close()
+    for key, value in result.as_dict().items():
+        print(f"{key:>20}: {value:.2f}" if isinstance(value, float) else f"{key:>20}: {value}")
+    return 0
+
+def run_headless_replay(args: argparse.Namespace) -> int:
+    """Replay a recorded log at I/O speed, persisting it if a database is given."""
+    import time
+    from simulator.core.utils.event_bus import EventBus
+    from simulator.core.utils.event_log import EventLog, EventReplayer
+    from simulator.database.database_listener import DatabaseListener
+    from simulator.database.database_manager import DatabaseManager
+
+    event_bus = EventBus()
+    if args.db is not None:
+        db_manager = DatabaseManager(args.db)
+        db_manager.setup_database(fresh_start=True)
+        db_listener = DatabaseListener(event_bus, db_manager)
+        db_listener.setup_subscriptions()
+
+    start = time.perf_counter()
+    replayer = EventReplayer(EventLog(args.replay), event_bus)
+    emitted = replayer.fast_forward(min(args.until, replayer.end_time))
+    if args.db is not None:
+        db_listener.flush()
+    print(f"Replayed {emitted} events up to {replayer.now} in {time.perf_counter() - start:.2f}s")
+    return 0
+
+def run_gui(replay_path: str | None = None) -> int:
+    from PyQt6.QtWidgets import QApplication
+    from simulator.application import Application
+
+    app = QApplication(sys.argv)
+    application = Application(replay_path=replay_path)
+    app.aboutToQuit.connect(application.shutdown)
+    application.run()
+    return app.exec()
 
 def main():
+    args = parse_args()
+
     # Setup logging to the terminal
     logging.basicConfig(
         level=logging.INFO,
@@ -14,10 +97,9 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Application starting up...")
 
-    app = QApplication(sys.argv)
-    application = Application()
-    application.run()
-    sys.exit(app.exec())
+    if args.headless:
+        sys.exit(run_headless(args))
+    sys.exit(run_gui(args.replay))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
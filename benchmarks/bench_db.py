@@ -0,0 +1,83 @@
+"""
+Compare database insert and query rates of the default SQLite setup against the tuned profile.
+
+'before' uses the default profile and drops the secondary indexes,
+'after' uses the performance profile with the indexes of the models.
+
+Usage: python -m benchmarks.bench_db [--pallets N] [--orders N] [--row-writes N] [--queries N]
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+import sqlalchemy
+from simulator.database.database_manager import DatabaseManager
+from simulator.database.models import Base, OrderStatus
+
+
+def _drop_secondary_indexes(manager: DatabaseManager):
+    with manager.engine.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(sqlalchemy.text(f"DROP INDEX IF EXISTS {index.name}"))
+
+
+def _rate(count: int, seconds: float) -> str:
+    return f"{count / seconds:>10.0f}/s"
+
+
+def run(name: str, directory: Path, profile: str, indexes: bool,
+        pallets: int, orders: int, row_writes: int, queries: int):
+    manager = DatabaseManager(f"sqlite:///{directory / f'{name}.db'}", profile=profile)
+    manager.setup_database(fresh_start=True)
+    if not indexes:
+        _drop_secondary_indexes(manager)
+    rng = random.Random(0)
+    manager.insert_item(item_id=1, name="Item", weight=1, category="Bench", volume=1, stackable=True)
+
+    # Batched writes, as flushed by the listener
+    start = time.perf_counter()
+    manager.write_batch(
+        pallets={pallet_id: dict(location="WH", last_updated_sim_time=rng.uniform(0, 3600),
+                                 stored=rng.random() < 0.98)
+                 for pallet_id in range(pallets)},
+        refill_orders={order_id: dict(order_time=rng.uniform(0, 3600), item_id=1, qty=10,
+                                      status=rng.choice(list(OrderStatus)))
+                       for order_id in range(orders)})
+    batched = time.perf_counter() - start
+
+    # Row-by-row commits, as the listener wrote before batching
+    start = time.perf_counter()
+    for pallet_id in range(row_writes):
+        manager.update_pallet(pallet_id=pallet_id, sim_time=3600.0, location="C1")
+    single = time.perf_counter() - start
+
+    # Dashboard queries: recent pending orders and active pallets
+    start = time.perf_counter()
+    for _ in range(queries):
+        manager.query_orders(status=OrderStatus.PENDING, min_order_time=3540.0, order_by='-order_time')
+        manager.query_pallets(stored=False, order_by='-last_updated_sim_time')
+    querying = time.perf_counter() - start
+
+    print(f"{name:<7} batched inserts {_rate(pallets + orders, batched)}  "
+          f"row commits {_rate(row_writes, single)}  queries {_rate(2 * queries, querying)}")
+    manager.engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pallets", type=int, default=50000)
+    parser.add_argument("--orders", type=int, default=50000)
+    parser.add_argument("--row-writes", type=int, default=1000)
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, profile, indexes in (("before", "default", False), ("after", "performance", True)):
+            run(name, Path(directory), profile, indexes,
+                args.pallets, args.orders, args.row_writes, args.queries)
+
+
+if __name__ == "__main__":
+    main()
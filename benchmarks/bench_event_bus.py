@@ -0,0 +1,50 @@
+"""
+Compare per-component dispatch of the keyed EventBus against filtering inside every subscriber.
+
+Usage: python -m benchmarks.bench_event_bus [--components N] [--events N]
+"""
+import argparse
+import time
+from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import ComponentStateChanged
+
+
+class _Listener:
+    def __init__(self, component_id: str):
+        self.id = component_id
+        self.calls = 0
+
+    def on_filtered(self, event):
+        if event.id == self.id:
+            self.calls += 1
+
+    def on_keyed(self, event):
+        self.calls += 1
+
+
+def run(components: int, events: int):
+    ids = [f"D{i}" for i in range(components)]
+    filtered, keyed = EventBus(), EventBus()
+    for component_id in ids:
+        filtered.subscribe("depalletizer_operating", _Listener(component_id).on_filtered)
+        keyed.subscribe("depalletizer_operating", _Listener(component_id).on_keyed, key=component_id)
+
+    for name, bus in (("filtered", filtered), ("keyed", keyed)):
+        start = time.perf_counter()
+        for i in range(events):
+            component_id = ids[i % components]
+            bus.emit("depalletizer_operating", ComponentStateChanged(id=component_id), key=component_id)
+        elapsed = time.perf_counter() - start
+        print(f"{name:<9} components={components:>5}  {events / elapsed:>12.0f} events/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--components", type=int, default=200)
+    parser.add_argument("--events", type=int, default=100000)
+    args = parser.parse_args()
+    run(args.components, args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Count the SimPy events processed by the default layout.
+
+Usage: python -m benchmarks.bench_event_count [--until SECONDS]
+"""
+import argparse
+from simulator.headless import HeadlessSimulation
+
+
+def run_scenario(name: str, until: float, refills: list[tuple[int, int]]):
+    simulation = HeadlessSimulation()
+    for item_id, qty in refills:
+        simulation.inventory_manager.place_refill_order(item_id, qty)
+    result = simulation.run(until=until)
+    print(f"{name:<10} events={result.events_processed:>9}  "
+          f"events/sim-hour={result.events_processed / until * 3600:>10.0f}  "
+          f"wall={result.wall_time:.3f}s  orders_completed={result.orders_completed}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--until", type=float, default=3600.0)
+    args = parser.parse_args()
+
+    run_scenario("idle", args.until, [])
+    run_scenario("loaded", args.until, [(1001, 200), (1002, 150), (1003, 100), (2001, 80)])
+
+
+if __name__ == "__main__":
+    main()
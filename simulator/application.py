@@ -1,7 +1,10 @@
 from simulator.core.factory.factory import Factory
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.event_log import EventLog, EventReplayer
 from simulator.database.database_listener import DatabaseListener
-from simulator.database.database_manager import DatabaseManager
+from simulator.database.database_manager import DatabaseManager, db_url
+from simulator.database.background_writer import BackgroundWriter
+from simulator.config import DB_BACKGROUND_WRITER
 import simpy
 from simulator.gui.main_window import MainWindow
 from simulator.gui.factory_scene import FactoryScene
@@ -13,33 +16,46 @@ class Application:
     """
     The Composition Root of the application.
     Owns all major components and wires them together.
+    If a recorded event log is given, the log is replayed instead of running the simulation.
     """
-    def __init__(self):
+    def __init__(self, replay_path: str | None = None):
         # Initialize core, independent services
         logger.info("Initializing core services...")
         self.event_bus = EventBus()
         self.env = simpy.Environment()
+        self.replayer: EventReplayer | None = None
+        if replay_path is not None:
+            logger.info(f"Replaying event log {replay_path}.")
+            self.replayer = EventReplayer(EventLog(replay_path), self.event_bus)
 
         # Create and setup data persistence
         logger.info("Setting up database schema...")
         self.db_manager = DatabaseManager()
         self.db_manager.setup_database(fresh_start=True)
-        self.db_listener = DatabaseListener(self.event_bus, self.db_manager)
-        self.db_listener.setup_subscriptions()
+        self.db_writer: BackgroundWriter | None = None
+        if DB_BACKGROUND_WRITER:
+            # Persist on a writer thread so that the GUI tick never waits for disk
+            self.db_writer = BackgroundWriter(db_url)
+            self.db_writer.setup_subscriptions(self.event_bus, self.db_manager)
+        else:
+            self.db_listener = DatabaseListener(self.event_bus, self.db_manager)
+            self.db_listener.setup_subscriptions()
 
         # Initialize simulation state
         logger.info("Initializing simulation state...")
         self.factory = Factory(self.env, self.event_bus)
-        self.factory.init_simulation()
-
-        logger.info("Database is now seeded with initial simulation data.")
+        if self.replayer is None:
+            self.factory.init_simulation()
+            logger.info("Database is now seeded with initial simulation data.")
+        # On replay the factory only provides the layout, state comes from the log
 
         # Initialize the user interface
         logger.info("Initializing user interface...")
         self.scene = FactoryScene(self.factory)
-        self.controller = SimulationController(self.env, self.scene)
+        self.controller = SimulationController(self.replayer or self.env, self.scene)
         self.controller.setup_subscriptions()
-        self.window = MainWindow(self.factory, self.scene, self.controller, self.db_manager)
+        self.window = MainWindow(self.factory, self.scene, self.controller, self.db_manager,
+                                 read_only=self.replayer is not None)
 
     def run(self):
         """
@@ -47,3 +63,12 @@ class Application:
         """
         logger.info("Showing main window and starting application.")
         self.window.show()
+
+    def shutdown(self):
+        """
+        Stops the simulation and writes out pending data before exit.
+        """
+        self.controller.stop()
+        if self.db_writer is not None:
+            logger.info("Waiting for the database writer to finish.")
+            self.db_writer.close()
@@ -58,3 +58,26 @@ EURO_PALLET_MAX_VOLUME = 2112.0    # dm^3 (Area x Height = 0.8m x 1.2m x 2.2m)
 # ------------------
 
 MAX_COMPONENT_LOG_COUNT = 50
+
+
+# ----------------------
+# Database write-behind
+# ----------------------
+
+DB_FLUSH_BATCH_SIZE = 500       # Buffered events before a flush
+DB_FLUSH_SIM_INTERVAL = 10.0    # Sim time between flushes
+DB_BACKGROUND_WRITER = True     # Persist on a writer thread in the GUI application
+DB_WRITER_QUEUE_SIZE = 10000    # Queued events before the simulation blocks on the writer
+
+# SQLite pragmas applied on every new connection
+DB_PROFILE = "performance"
+DB_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",          # Readers do not block the writer
+        "synchronous": "NORMAL",        # No fsync per commit, safe with WAL
+        "cache_size": -65536,           # 64 MiB page cache
+        "mmap_size": 268435456,         # 256 MiB memory mapped I/O
+        "temp_store": "MEMORY",
+    },
+}
@@ -5,9 +5,11 @@ from simulator.core.transportation_units.transportation_unit import Location
 from simulator.core.transportation_units.item_batch import ItemBatch
 from simulator.config import BATCH_BUFFER_PROCESS_TIME, BATCH_MAX_WAIT_TIME
 from simulator.core.utils.id_gen_config import id_generator
-from simulator.gui.component_items import BatchState
+from simulator.core.transportation_units.payload_state import BatchState
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import PayloadCreated, PayloadUpdated, ComponentStateChanged
 from simulator.core.utils.logging_config import log_manager
+from simulator.core.utils.notifier import Notifier
 
 
 class BatchBuilder(Component):
@@ -26,6 +28,8 @@ class BatchBuilder(Component):
         Buffer for Batch building.
     current_batch : ItemBatch
         Current batch being built
+    batch_created : Notifier
+        Wakes up the building loop when a new batch is started.
     """
     def __init__(self, env: simpy.Environment, builder_id: str,
                  coordinate : tuple[int,int],
@@ -42,6 +46,7 @@ class BatchBuilder(Component):
                                      process_time=batch_process_time)
 
         self._current_batch : ItemBatch | None = None
+        self._batch_created = Notifier(env)
 
     # ----------
     # Properties
@@ -93,7 +98,7 @@ class BatchBuilder(Component):
             new_batch = ItemBatch(batch_id=batch_id, current_location=Location(self._component_id, self._coordinate))
 
             if self.event_bus is not None:
-                self.event_bus.emit("create_batch", {"id": batch_id})
+                self.event_bus.emit("create_batch", PayloadCreated(id=batch_id))
 
             log_manager.log(f"Created {new_batch}", f"{self}", sim_time=self.env.now)
 
@@ -101,6 +106,7 @@ class BatchBuilder(Component):
             self._current_batch = new_batch # Save instance internally
             # Event for signaling readiness
             self._current_batch.ready_event = self.env.event()
+            self._batch_created.notify()
 
         if self._current_batch.ready_event.triggered:
             # If ready event is triggered, cannot load
@@ -108,14 +114,22 @@ class BatchBuilder(Component):
         self._current_batch.add_item(item_id)
         return True
 
+    def snapshot_state(self, payloads: dict) -> dict:
+        return {"buffer": self._buffer.snapshot_state(payloads)}
+
+    def restore_state(self, state: dict, payloads: dict):
+        """A restored batch keeps building, its max wait time starts again from the restore time."""
+        self._buffer.restore_state(state["buffer"], payloads)
+        self._current_batch = self._buffer.payload
+
     def _handoff_batch(self):
         """Batch leaves via buffer handoff."""
         yield from self._buffer.handoff()
 
         if self.event_bus is not None:
-            self.event_bus.emit("update_payload", {
-                "id": self._current_batch.id,
-                "state": BatchState.READY})
+            self.event_bus.emit("update_payload", PayloadUpdated(
+                id=self._current_batch.id,
+                state=BatchState.READY))
 
         self._current_batch = None # Clear current batch
 
@@ -126,20 +140,22 @@ class BatchBuilder(Component):
         """
         while True:
             while self._current_batch is None:
-                # Wait until a batch exists
-                yield self.env.timeout(0.5)
+                # Sleep until a batch exists
+                yield self._batch_created.wait()
 
             batch = self._current_batch
 
             if self.event_bus is not None:
-                self.event_bus.emit("batch_builder_building", {"id":self._component_id})
+                self.event_bus.emit("batch_builder_building", ComponentStateChanged(id=self._component_id),
+                                   key=self._component_id)
 
             # Wait for either batch ready event OR timeout
             timeout_event = self.env.timeout(BATCH_MAX_WAIT_TIME)
             yield batch.ready_event | timeout_event
 
             if self.event_bus is not None:
-                self.event_bus.emit("batch_builder_idle", {"id":self._component_id})
+                self.event_bus.emit("batch_builder_idle", ComponentStateChanged(id=self._component_id),
+                                   key=self._component_id)
 
             # Handoff batch
             yield self.env.process(self._handoff_batch())
\ No newline at end of file
@@ -1,6 +1,7 @@
 import simpy
 from abc import ABC, abstractmethod
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.notifier import Notifier
 
 class Component(ABC):
     """
@@ -21,6 +22,8 @@ class Component(ABC):
         Allow named outputs for components with multiple.
     event_bus : EventBus
         Bridge to communicate with gui.
+    space_freed : Notifier
+        Wakes up processes waiting for the component to become loadable.
     """
     def __init__(self, env: simpy.Environment, component_id: str):
         self.env = env
@@ -29,6 +32,7 @@ class Component(ABC):
         self._output: None | Component = None
         self._outputs: dict[str, "Component"] = {}
         self.event_bus: None | EventBus = None
+        self._space_freed = Notifier(env)
 
     # ----------
     # Properties
@@ -67,9 +71,24 @@ class Component(ABC):
         """Load payload on component. Implementation depends on component type"""
         pass
 
+    def wait_for_space(self):
+        """Event triggered when the component frees room for loading. Overridable"""
+        return self._space_freed.wait()
+
     def inject_event_bus(self, event_bus: EventBus):
         """Inject event bus. Overloadable"""
         self.event_bus = event_bus
 
+    def snapshot_state(self, payloads: dict) -> dict:
+        """
+        Return the internal state for a snapshot. Held payloads are referenced by id
+        and added to the given payloads dict. Overridable
+        """
+        return {}
+
+    def restore_state(self, state: dict, payloads: dict):
+        """Restore a state returned by snapshot_state, before the simulation is resumed. Overridable"""
+        pass
+
     def __repr__(self):
         return f"{self._type}({self._component_id})"
\ No newline at end of file
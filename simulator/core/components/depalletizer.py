@@ -6,7 +6,8 @@ from simulator.core.orders.order import OrderStatus, RefillOrder
 from simulator.config import PALLET_BUFFER_PROCESS_TIME, ITEM_PROCESS_TIME, DEPALLETIZING_DELAY
 import simpy
 from simulator.core.utils.event_bus import EventBus
-from simulator.gui.component_items import PALLET_ORDER_STATES
+from simulator.core.utils.events import PayloadUpdated, OrderUpdated, ComponentStateChanged
+from simulator.core.transportation_units.payload_state import PALLET_ORDER_STATES
 from simulator.core.utils.logging_config import log_manager
 
 
@@ -121,6 +122,10 @@ class Depalletizer(Component):
     def can_load(self) -> bool:
         return self._buffer.can_load()
 
+    def wait_for_space(self):
+        """Override base wait. Delegate to internal buffer."""
+        return self._buffer.wait_for_space()
+
     def load(self, pallet: SystemPallet):
         """Route pallet through buffer first."""
         if self.can_load():
@@ -137,11 +142,24 @@ class Depalletizer(Component):
             return self._output.load(item_id) # Indicate loading success
         return False
 
+    def snapshot_state(self, payloads: dict) -> dict:
+        return {"buffer": self._buffer.snapshot_state(payloads),
+                "current_item_id": self._current_item_id,
+                "remaining_qty": self._remaining_qty}
+
+    def restore_state(self, state: dict, payloads: dict):
+        """A pallet restored mid-process continues from the remaining quantity."""
+        self._buffer.restore_state(state["buffer"], payloads)
+        self._current_item_id = state["current_item_id"]
+        self._remaining_qty = state["remaining_qty"]
+
     def _depal_loop(self):
         """Main depalletizing loop."""
         while True:
-            self._buffer.on_load_event = self.env.event()
-            pallet = yield self._buffer.on_load_event  # wait for pallet
+            pallet = self._buffer.payload
+            if pallet is None:
+                self._buffer.on_load_event = self.env.event()
+                pallet = yield self._buffer.on_load_event  # wait for pallet
 
             if pallet is None:
                 # Wait until a pallet exists
@@ -156,16 +174,19 @@ class Depalletizer(Component):
                 yield self.env.process(self._handoff_pallet())
                 continue
 
-            if isinstance(order, RefillOrder):
-                self._current_item_id = order.item_id
-                self._remaining_qty = order.qty
+            if self._current_item_id is None:
+                # Not started yet. A pallet restored from a snapshot keeps its progress
+                if isinstance(order, RefillOrder):
+                    self._current_item_id = order.item_id
+                    self._remaining_qty = order.qty
 
-            yield self.env.timeout(DEPALLETIZING_DELAY)  # Add a little delay before depalletizing is started
-            log_manager.log(f"Depalletizing {pallet} with {order}", f"{self}", sim_time=self.env.now)
+                yield self.env.timeout(DEPALLETIZING_DELAY)  # Add a little delay before depalletizing is started
+                log_manager.log(f"Depalletizing {pallet} with {order}", f"{self}", sim_time=self.env.now)
 
             # Process items
             if self.event_bus is not None:
-                self.event_bus.emit("depalletizer_operating", {"id":self._component_id})
+                self.event_bus.emit("depalletizer_operating", ComponentStateChanged(id=self._component_id),
+                                   key=self._component_id)
 
             while self._remaining_qty > 0:
                 success = yield self.env.process(self._process_item(self._current_item_id))
@@ -181,18 +202,18 @@ class Depalletizer(Component):
             pallet.clear_order()
 
             if self.event_bus is not None:
-                self.event_bus.emit("update_payload", {
-                    "id": pallet.id,
-                    "type": pallet.__class__.__name__,
-                    "destination": f"{pallet.destination}",
-                    "state": PALLET_ORDER_STATES["Empty"],
-                    "sim_time": self.env.now})
-                self.event_bus.emit("update_order", {
-                    "order_id": order.id,
-                    "status": order.status,
-                    "completion_time": self.env.now
-                })
-                self.event_bus.emit("depalletizer_idle", {"id":self._component_id})
+                self.event_bus.emit("update_payload", PayloadUpdated(
+                    id=pallet.id,
+                    type=pallet.__class__.__name__,
+                    destination=f"{pallet.destination}",
+                    state=PALLET_ORDER_STATES["Empty"],
+                    sim_time=self.env.now))
+                self.event_bus.emit("update_order", OrderUpdated(
+                    order_id=order.id,
+                    status=order.status,
+                    completion_time=self.env.now))
+                self.event_bus.emit("depalletizer_idle", ComponentStateChanged(id=self._component_id),
+                                    key=self._component_id)
 
             # Send empty pallet downstream
             yield self.env.process(self._handoff_pallet())
\ No newline at end of file
@@ -83,6 +83,10 @@ class Junction(Component):
     def can_load(self) -> bool:
         return self._buffer.can_load()
 
+    def wait_for_space(self):
+        """Override base wait. Delegate to internal buffer."""
+        return self._buffer.wait_for_space()
+
     def load(self, payload: TransportationUnit):
         """Route payload through buffer first."""
         if self.can_load():
@@ -92,11 +96,23 @@ class Junction(Component):
         """Empty pallet leaves via buffer handoff."""
         yield from self._buffer.handoff(port)
 
+    def snapshot_state(self, payloads: dict) -> dict:
+        return {"buffer": self._buffer.snapshot_state(payloads),
+                "current_port_index": self._current_port_index,
+                "pallets_sent_to_current_port": self._pallets_sent_to_current_port}
+
+    def restore_state(self, state: dict, payloads: dict):
+        self._buffer.restore_state(state["buffer"], payloads)
+        self._current_port_index = state["current_port_index"]
+        self._pallets_sent_to_current_port = state["pallets_sent_to_current_port"]
+
     def _routing_loop(self):
         """Main routing loop."""
         while True:
-            self._buffer.on_load_event = self.env.event()
-            pallet = yield self._buffer.on_load_event  # wait for pallet
+            pallet = self._buffer.payload
+            if pallet is None:
+                self._buffer.on_load_event = self.env.event()
+                pallet = yield self._buffer.on_load_event  # wait for pallet
 
             if pallet is None:
                 # Wait until a pallet exists
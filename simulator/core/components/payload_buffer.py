@@ -3,6 +3,7 @@ from simulator.core.components.component import Component
 from simulator.core.transportation_units.system_pallet import TransportationUnit
 from simulator.config import PALLET_BUFFER_PROCESS_TIME
 from simulator.core.utils.logging_config import log_manager
+from simulator.core.utils.events import PayloadMoved
 
 
 class PayloadBuffer(Component):
@@ -60,12 +61,13 @@ class PayloadBuffer(Component):
 
             # Notify gui of event
             if self.event_bus is not None:
-                self.event_bus.emit("move_payload", {
-                    "id": payload.id,
-                    "type": payload.__class__.__name__,
-                    "location": f"{payload.location}",
-                    "sim_time": self.env.now,
-                    "coords": self._coordinate})
+                self.event_bus.emit("move_payload", PayloadMoved(
+                    id=payload.id,
+                    type=payload.__class__.__name__,
+                    location=f"{payload.location}",
+                    sim_time=self.env.now,
+                    coords=self._coordinate,
+                    component_id=self._component_id), key=self._component_id)
 
             # Fire event if buffer owner is waiting
             if self.on_load_event and not self.on_load_event.triggered:
@@ -83,13 +85,26 @@ class PayloadBuffer(Component):
         if output and self._payload is not None:
             # Wait until output becomes available for loading
             while not output.can_load():
-                yield self.env.timeout(0.5)
+                yield output.wait_for_space()
 
             yield self.env.timeout(self._process_time)  # process delay
             log_manager.log(f"Unloaded {self._payload} to {output}", f"{self}", sim_time=self.env.now)
             output.load(self._payload)
             self._payload = None
+            self._space_freed.notify()
 
     def clear(self):
         """Clear any payload from buffer"""
-        self._payload = None
\ No newline at end of file
+        self._payload = None
+        self._space_freed.notify()
+
+    def snapshot_state(self, payloads: dict) -> dict:
+        if self._payload is None:
+            return {"payload": None}
+        payloads[self._payload.id] = self._payload
+        return {"payload": self._payload.id}
+
+    def restore_state(self, state: dict, payloads: dict):
+        """Place the payload without loading it, the buffer owner picks it up when resumed."""
+        payload_id = state["payload"]
+        self._payload = payloads[payload_id] if payload_id is not None else None
\ No newline at end of file
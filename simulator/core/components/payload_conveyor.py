@@ -4,6 +4,8 @@ from simulator.core.transportation_units.transportation_unit import Transportati
 from typing import List
 from simulator.config import CONVEYOR_CYCLE_TIME
 from simulator.core.utils.logging_config import log_manager
+from simulator.core.utils.notifier import Notifier
+from simulator.core.utils.events import PayloadMoved
 
 
 class PayloadConveyor(Component):
@@ -31,6 +33,8 @@ class PayloadConveyor(Component):
         List of each slot coordinate.
     previously_loaded : bool
         Flag to track if conveyor was previously loaded
+    loaded : Notifier
+        Wakes up the conveying loop when a payload is loaded.
     """
     def __init__(self, env: simpy.Environment, conveyor_id: str,
                  start: tuple[int,int], end: tuple[int,int],
@@ -53,6 +57,7 @@ class PayloadConveyor(Component):
         self._slot_coords = self._calculate_slots(start, end, self._num_slots)
 
         self.previously_loaded = False
+        self._loaded = Notifier(env)
 
     # ----------
     # Properties
@@ -116,23 +121,32 @@ class PayloadConveyor(Component):
 
             # Notify gui of event
             if self.event_bus is not None:
-                self.event_bus.emit("move_payload", {
-                    "id":payload.id,
-                    "sim_time": self.env.now,
-                    "type": payload.__class__.__name__,
-                    "location": f"{payload.location}",
-                    "coords":self._slot_coords[0]})
+                self.event_bus.emit("move_payload", PayloadMoved(
+                    id=payload.id,
+                    type=payload.__class__.__name__,
+                    location=f"{payload.location}",
+                    sim_time=self.env.now,
+                    coords=self._slot_coords[0],
+                    component_id=self._component_id), key=self._component_id)
 
             self.previously_loaded = True
+            self._loaded.notify()
+
+    def shift(self) -> bool:
+        """
+        Shift transportation units one slot forward if possible.
+        Return truth value indicating if any payload moved.
+        """
+        moved = False
+        notify = self.event_bus is not None and self.event_bus.has_subscribers("move_payload", self._component_id)
 
-    def shift(self):
-        """Shift transportation units one slot forward if possible."""
         # Try to unload the last slot into downstream
         if self._output and self._slots[-1] is not None:
             payload = self._slots[-1]
             if self._output.can_load():
                 self.env.process(self._handoff(payload, self._output))
                 self._slots[-1] = None
+                moved = True
 
         # Traverse backwards to not overwrite slots
         for i in reversed(range(1, self.num_slots)):
@@ -145,18 +159,40 @@ class PayloadConveyor(Component):
                 payload.location.update(coordinates=self._slot_coords[i])
                 self._slots[i] = self._slots[i - 1]
                 self._slots[i - 1] = None
+                moved = True
 
                 # Notify gui of event
-                if self.event_bus is not None:
-                    self.event_bus.emit("move_payload", {
-                        "id": payload.id,
-                        "sim_time": self.env.now,
-                        "type": payload.__class__.__name__,
-                        "location": f"{payload.location}",
-                        "coords": self._slot_coords[i]})
+                if notify:
+                    self.event_bus.emit("move_payload", PayloadMoved(
+                        id=payload.id,
+                        type=payload.__class__.__name__,
+                        location=f"{payload.location}",
+                        sim_time=self.env.now,
+                        coords=self._slot_coords[i],
+                        component_id=self._component_id), key=self._component_id)
 
         self.previously_loaded = False
 
+        if moved and self._slots[0] is None:
+            self._space_freed.notify()
+        return moved
+
+    def snapshot_state(self, payloads: dict) -> dict:
+        slots = []
+        for payload in self._slots:
+            if payload is not None:
+                payloads[payload.id] = payload
+            slots.append(payload.id if payload is not None else None)
+        return {"slots": slots, "previously_loaded": self.previously_loaded}
+
+    def restore_state(self, state: dict, payloads: dict):
+        """Refill the slots. The conveying loop starts its next cycle from the restore time."""
+        if len(state["slots"]) != self._num_slots:
+            raise ValueError(f"Snapshot of {self} has {len(state['slots'])} slots, expected {self._num_slots}.")
+        self._slots = [payloads[payload_id] if payload_id is not None else None
+                       for payload_id in state["slots"]]
+        self.previously_loaded = state["previously_loaded"]
+
     def _handoff(self, payload: TransportationUnit, downstream):
         """Schedule payload unloading for the downstream elements next event turn"""
         yield self.env.timeout(0)  # schedule for "next event turn"
@@ -166,9 +202,14 @@ class PayloadConveyor(Component):
     def _conveying_loop(self):
         """Main conveyor loop."""
         while True:
-            while all(slot is None for slot in self._slots):
-                # Wait until conveyor is non-empty
-                yield self.env.timeout(0.5)
+            if all(slot is None for slot in self._slots):
+                # Sleep until a payload gets loaded
+                yield self._loaded.wait()
 
             yield self.env.timeout(self._cycle_time)
-            self.shift()
\ No newline at end of file
+            if not self.shift():
+                # Nothing can move, sleep until downstream frees space or a payload gets loaded
+                wakeups = [self._loaded.wait()]
+                if self._output is not None:
+                    wakeups.append(self._output.wait_for_space())
+                yield self.env.any_of(wakeups)
\ No newline at end of file
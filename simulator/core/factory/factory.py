@@ -9,6 +9,7 @@ from simulator.core.items.catalogue import Catalogue
 from pathlib import Path
 from simulator.config import ITEM_JSON, FACTORY_JSON, WAREHOUSE_MAX_PALLET_CAPACITY
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import ItemCreated
 from simulator.core.utils.id_gen_config import id_generator
 
 class Factory:
@@ -93,14 +94,13 @@ class Factory:
     def _emit_catalogue_items(self):
         """Emit all items in catalogue through event bus for database setup."""
         for item_id, item in self.catalogue.items:
-            self.event_bus.emit("create_item", {
-                "item_id": item_id,
-                "name": item.name,
-                "weight": item.weight,
-                "category": item.category,
-                "volume": item.volume,
-                "stackable": item.stackable
-            })
+            self.event_bus.emit("create_item", ItemCreated(
+                item_id=item_id,
+                name=item.name,
+                weight=item.weight,
+                category=item.category,
+                volume=item.volume,
+                stackable=item.stackable))
 
     # --------------
     # Public methods
@@ -8,7 +8,9 @@ from simulator.core.components.batch_builder import BatchBuilder
 from simulator.core.transportation_units.item_batch import ItemBatch
 from simulator.config import ITEM_PROCESS_TIME, ITEM_WAREHOUSE_MAX_ITEM_CAPACITY, BATCH_BUFFER_PROCESS_TIME
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import OrderCreated, PayloadStored, StockCount
 from simulator.core.utils.logging_config import log_manager
+from simulator.core.utils.notifier import Notifier
 
 
 class ItemWarehouse(Stock):
@@ -52,6 +54,12 @@ class ItemWarehouse(Stock):
         Time in simulation units it takes to process (load) one batch
     requested_items_queue : simpy.Store
         A queue for external managers to know which items are needed
+    capacity_freed : Notifier
+        Wakes up batch loading waiting for room in the stock.
+    stock_added : Notifier
+        Wakes up the order loop when items are added to the stock.
+    stocked_batches : set[int]
+        Batches whose items are already in stock but which still occupy an input buffer.
     """
     def __init__(self, env: simpy.Environment,
                  item_process_time: float = ITEM_PROCESS_TIME,
@@ -72,6 +80,9 @@ class ItemWarehouse(Stock):
         self._item_process_time = item_process_time
         self._batch_process_time = batch_process_time
         self.requested_items_queue = simpy.Store(env)
+        self._capacity_freed = Notifier(env)
+        self._stock_added = Notifier(env)
+        self._stocked_batches: set[int] = set()
 
     # ----------
     # Properties
@@ -146,15 +157,14 @@ class ItemWarehouse(Stock):
         """Insert an order with given priority (lower = higher priority)."""
         count = next(self._counter)  # Prevents comparasion errors when priorities match
         heapq.heappush(self._order_queue, (priority, count, order))
+        self._order_placed.notify()
         if self.event_bus is not None:
-            self.event_bus.emit("item_warehouse_order_count", {
-                "count": len(self._order_queue)})
-            self.event_bus.emit("create_order", {
-                "order_id": order.id,
-                "order_time": order.order_time,
-                "type": order.type,
-                "items": order.items
-            })
+            self.event_bus.emit("item_warehouse_order_count", StockCount(count=len(self._order_queue)))
+            self.event_bus.emit("create_order", OrderCreated(
+                order_id=order.id,
+                order_time=order.order_time,
+                type=order.type,
+                items=dict(order.items)))
 
     def process_order(self, order: OpmOrder, buffer: BatchBuilder):
         """Process an order by taking items from stock and simulating the picking time."""
@@ -166,6 +176,7 @@ class ItemWarehouse(Stock):
         for item_id, qty in order.items.items():
             self._item_stock[item_id] -= qty
             self._item_count -= qty
+        self._capacity_freed.notify()
 
         # Simulate picking and processing time
         processing_time = len(order.items) * self._item_process_time
@@ -178,49 +189,76 @@ class ItemWarehouse(Stock):
         if self.event_bus is not None:
             fill_percentage = math.ceil(self._item_count / self._item_capacity) * 100
             self.event_bus.emit("item_warehouse_item_count",
-                                {"count": self._item_count, "fill": fill_percentage})
-            self.event_bus.emit("item_warehouse_order_count", {"count": len(self._order_queue)})
+                                StockCount(count=self._item_count, fill=fill_percentage))
+            self.event_bus.emit("item_warehouse_order_count", StockCount(count=len(self._order_queue)))
 
     def inject_eventbus(self, event_bus: EventBus):
         self.event_bus = event_bus
         # Emit item and order count
         fill_percentage = math.ceil(self._item_count / self._item_capacity) * 100
         self.event_bus.emit("item_warehouse_item_count",
-                            {"count": self._item_count, "fill":fill_percentage})
-        self.event_bus.emit("item_warehouse_order_count", {"count": len(self._order_queue)})
+                            StockCount(count=self._item_count, fill=fill_percentage))
+        self.event_bus.emit("item_warehouse_order_count", StockCount(count=len(self._order_queue)))
 
     def _load_batch(self, batch: ItemBatch):
         """Load items from batch into storage."""
-        batch_item_count = batch.item_count
-        # Wait until there is room for the batch items
-        while self._item_count + batch_item_count > self._item_capacity:
-            yield self.env.timeout(0.5)
-        self._item_count += batch_item_count
-
-        # Load items
-        items = batch.items
-        for item, qty in items.items():
-            self._item_stock.setdefault(item, 0)
-            self._available_item_stock.setdefault(item, 0)
-            self._item_stock[item] += qty
-            self._available_item_stock[item] += qty
+        if batch.id not in self._stocked_batches:
+            batch_item_count = batch.item_count
+            # Wait until there is room for the batch items
+            while self._item_count + batch_item_count > self._item_capacity:
+                yield self._capacity_freed.wait()
+            self._item_count += batch_item_count
+
+            # Load items
+            items = batch.items
+            for item, qty in items.items():
+                self._item_stock.setdefault(item, 0)
+                self._available_item_stock.setdefault(item, 0)
+                self._item_stock[item] += qty
+                self._available_item_stock[item] += qty
+            self._stocked_batches.add(batch.id)
+            self._stock_added.notify()
         yield self.env.timeout(self._batch_process_time)
 
         if self.event_bus is not None:
             fill_percentage = math.ceil(self._item_count / self._item_capacity) * 100
             self.event_bus.emit("item_warehouse_item_count",
-                                {"count": self._item_count, "fill":fill_percentage})
+                                StockCount(count=self._item_count, fill=fill_percentage))
+
+    def snapshot_state(self, payloads: dict, orders: dict) -> dict:
+        return {"item_stock": list(self._item_stock.items()),
+                "available_item_stock": list(self._available_item_stock.items()),
+                "item_count": self._item_count,
+                "order_queue": self._queue_state(self._order_queue, orders),
+                "processable_order_queue": self._queue_state(self._processable_order_queue, orders),
+                "stock_requested_orders": sorted(self._stock_requested_orders),
+                "requested_items": list(self.requested_items_queue.items),
+                "stocked_batches": sorted(self._stocked_batches)}
+
+    def restore_state(self, state: dict, payloads: dict, orders: dict):
+        self._item_stock = {item_id: qty for item_id, qty in state["item_stock"]}
+        self._available_item_stock = {item_id: qty for item_id, qty in state["available_item_stock"]}
+        self._item_count = state["item_count"]
+        self._order_queue = self._restore_queue(state["order_queue"], orders)
+        self._processable_order_queue = self._restore_queue(state["processable_order_queue"], orders)
+        self._advance_counter(state["order_queue"] + state["processable_order_queue"])
+        self._stock_requested_orders = set(state["stock_requested_orders"])
+        self.requested_items_queue.items[:] = [dict(request) for request in state["requested_items"]]
+        self._stocked_batches = set(state["stocked_batches"])
 
     def _listen_for_batch(self, buffer: PayloadBuffer):
         """Continuously listen for batches arriving in input buffer."""
         while True:
-            buffer.on_load_event = self.env.event()
-            batch = yield buffer.on_load_event
+            batch = buffer.payload
+            if batch is None:
+                buffer.on_load_event = self.env.event()
+                batch = yield buffer.on_load_event
             yield self.env.process(self._load_batch(batch))
             buffer.clear() # Clear pallet from buffer
+            self._stocked_batches.discard(batch.id)
             
             if self.event_bus is not None:
-                self.event_bus.emit("store_payload", {"id":batch.id})
+                self.event_bus.emit("store_payload", PayloadStored(id=batch.id))
             log_manager.log(f"Stored batch {batch}",
                         component_id=self.__class__.__name__,
                         sim_time=self.env.now)
@@ -244,8 +282,8 @@ class ItemWarehouse(Stock):
         while True:
             # Wait until there is at least one order in the main queue
             if not self._has_orders():
-                 yield self.env.timeout(0.5)
-                 continue
+                yield self._order_placed.wait()
+                continue
 
             # Use a temporary list to hold orders that are not ready yet
             pending_orders = []
@@ -270,4 +308,5 @@ class ItemWarehouse(Stock):
             for entry in pending_orders:
                 heapq.heappush(self._order_queue, entry)
 
-            yield self.env.timeout(1)
+            # Sleep until new orders arrive or stock gets added
+            yield self._order_placed.wait() | self._stock_added.wait()
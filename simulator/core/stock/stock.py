@@ -3,6 +3,7 @@ import heapq
 from abc import ABC, abstractmethod
 from simulator.core.orders.order import Order
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.notifier import Notifier
 import itertools
 
 class Stock(ABC):
@@ -17,13 +18,16 @@ class Stock(ABC):
         SimPy process instance for monitoring and processing orders
     order_queue : min-heap
         Internal priority queue for handling orders based on priority.
+    order_placed : Notifier
+        Wakes up the order loop when a new order is placed.
     """
     _counter = itertools.count()  # shared counter across all instances
 
     def __init__(self, env: simpy.Environment):
         self.env = env
-        self.process_order_main = self.env.process(self._order_loop())
         self._order_queue = []
+        self._order_placed = Notifier(env)
+        self.process_order_main = self.env.process(self._order_loop())
         self.event_bus: None | EventBus = None
 
     # ---------------
@@ -39,6 +43,29 @@ class Stock(ABC):
     def _has_orders(self) -> bool:
         return len(self._order_queue) > 0
 
+    @staticmethod
+    def _queue_state(queue: list, orders: dict) -> list:
+        """Order queue entries as [priority, count, order id]. Orders are added to the given orders dict."""
+        entries = []
+        for priority, count, order in queue:
+            orders[order.id] = order
+            entries.append([priority, count, order.id])
+        return entries
+
+    @staticmethod
+    def _restore_queue(entries: list, orders: dict) -> list:
+        """Rebuild an order queue from _queue_state entries."""
+        queue = [(priority, count, orders[order_id]) for priority, count, order_id in entries]
+        heapq.heapify(queue)
+        return queue
+
+    @staticmethod
+    def _advance_counter(entries: list):
+        """Make sure orders placed after a restore are queued behind the restored ones."""
+        start = max((count for _, count, _ in entries), default=-1) + 1
+        # The counter is shared by all stocks, never rebind it on a subclass
+        Stock._counter = itertools.count(max(start, next(Stock._counter)))
+
     # ----------
     #   Logic
     # ----------
@@ -51,6 +78,19 @@ class Stock(ABC):
     def inject_eventbus(self, event_bus: EventBus):
         pass
 
+    @abstractmethod
+    def snapshot_state(self, payloads: dict, orders: dict) -> dict:
+        """
+        Return the stock state for a snapshot. Payloads and orders are referenced by id
+        and added to the given dicts.
+        """
+        pass
+
+    @abstractmethod
+    def restore_state(self, state: dict, payloads: dict, orders: dict):
+        """Restore a state returned by snapshot_state, before the simulation is resumed."""
+        pass
+
     @abstractmethod
     def _order_loop(self):
         pass
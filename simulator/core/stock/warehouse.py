@@ -7,8 +7,9 @@ from simulator.core.components.payload_buffer import PayloadBuffer
 from simulator.core.transportation_units.system_pallet import SystemPallet
 from simulator.core.transportation_units.transportation_unit import Location
 from simulator.config import ORDER_MERGE_TIME, WAREHOUSE_MAX_PALLET_CAPACITY, PALLET_BUFFER_PROCESS_TIME
-from simulator.gui.component_items import PALLET_ORDER_STATES
+from simulator.core.transportation_units.payload_state import PALLET_ORDER_STATES
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import PalletCreated, PayloadCreated, PayloadUpdated, PayloadStored, OrderCreated, OrderUpdated, StockCount
 from simulator.core.utils.logging_config import log_manager
 
 
@@ -37,6 +38,8 @@ class Warehouse(Stock):
         Max amount of pallets the warehouse can store.
     pallet_count : int
         Track the amount of pallets stored
+    processing_order : RefillOrder
+        Order taken from the queue but not yet merged on the output buffer pallet.
     """
     def __init__(self, env: simpy.Environment,
                  order_process_time: float = ORDER_MERGE_TIME,
@@ -51,6 +54,7 @@ class Warehouse(Stock):
         self._pallet_store = simpy.Store(env, pallet_capacity)
         self._pallet_capacity = pallet_capacity
         self._pallet_count = 0
+        self._processing_order: RefillOrder | None = None
 
     # ----------
     # Properties
@@ -108,11 +112,10 @@ class Warehouse(Stock):
                                   current_location=Location(element_name=self.__class__.__name__,
                                                             coordinates=self._output_buffer.coordinate))
         if self.event_bus is not None:
-            self.event_bus.emit("create_pallet", {
-                "pallet_id": pallet_id,
-                "location": self.__class__.__name__,
-                "sim_time": self.env.now
-            })
+            self.event_bus.emit("create_pallet", PalletCreated(
+                pallet_id=pallet_id,
+                location=self.__class__.__name__,
+                sim_time=self.env.now))
 
         self._pallet_store.put(new_pallet)
         self._pallet_count += 1
@@ -122,15 +125,15 @@ class Warehouse(Stock):
         """Insert an order with given priority (lower = higher priority)."""
         count = next(self._counter)  # Prevents comparasion errors when priorities match
         heapq.heappush(self._order_queue, (priority, count, order))
+        self._order_placed.notify()
         if self.event_bus is not None:
-            self.event_bus.emit("warehouse_order_count", {"count":len(self._order_queue)})
-            self.event_bus.emit("create_order", {
-                "order_id": order.id,
-                "order_time": order.order_time,
-                "type": order.type,
-                "item_id": order.item_id,
-                "qty": order.qty
-            })
+            self.event_bus.emit("warehouse_order_count", StockCount(count=len(self._order_queue)))
+            self.event_bus.emit("create_order", OrderCreated(
+                order_id=order.id,
+                order_time=order.order_time,
+                type=order.type,
+                item_id=order.item_id,
+                qty=order.qty))
 
     def process_order(self, order: RefillOrder):
         """Process order by merging it on the pallet on buffer."""
@@ -150,19 +153,17 @@ class Warehouse(Stock):
             order.status = OrderStatus.IN_PROGRESS # Update order status to pending
 
             if self.event_bus is not None:
-                self.event_bus.emit("update_payload",{
-                    "id": pallet.id,
-                    "type": pallet.__class__.__name__,
-                    "order_id": order.id,
-                    "destination": f"{pallet.destination}",
-                    "state": PALLET_ORDER_STATES[order.type],
-                    "sim_time": self.env.now})
-                self.event_bus.emit("update_order", {
-                    "order_id": order.id,
-                    "status": order.status
-                })
-                self.event_bus.emit("warehouse_order_count", {
-                    "count": len(self._order_queue)})
+                self.event_bus.emit("update_payload", PayloadUpdated(
+                    id=pallet.id,
+                    type=pallet.__class__.__name__,
+                    order_id=order.id,
+                    destination=f"{pallet.destination}",
+                    state=PALLET_ORDER_STATES[order.type],
+                    sim_time=self.env.now))
+                self.event_bus.emit("update_order", OrderUpdated(
+                    order_id=order.id,
+                    status=order.status))
+                self.event_bus.emit("warehouse_order_count", StockCount(count=len(self._order_queue)))
 
             log_manager.log(f"Processed order {order}",
                         component_id=self.__class__.__name__,
@@ -171,8 +172,10 @@ class Warehouse(Stock):
     def _listen_for_pallets(self):
         """Continuously listen for pallets arriving in the input buffer."""
         while True:
-            self._input_buffer.on_load_event = self.env.event()
-            pallet = yield self._input_buffer.on_load_event  # wait for pallet
+            pallet = self._input_buffer.payload
+            if pallet is None:
+                self._input_buffer.on_load_event = self.env.event()
+                pallet = yield self._input_buffer.on_load_event  # wait for pallet
 
             yield self.env.timeout(self._pallet_process_time) # Pallet processing delay
             yield self._pallet_store.put(pallet)
@@ -180,73 +183,100 @@ class Warehouse(Stock):
             self._input_buffer.clear() # Clear pallet from buffer
 
             if self.event_bus is not None:
-                self.event_bus.emit("store_payload", {
-                    "id":pallet.id,
-                    "type": pallet.__class__.__name__,
-                    "location": self.__class__.__name__,
-                    "sim_time": self.env.now})
+                self.event_bus.emit("store_payload", PayloadStored(
+                    id=pallet.id,
+                    type=pallet.__class__.__name__,
+                    location=self.__class__.__name__,
+                    sim_time=self.env.now))
 
                 fill_percentage = math.ceil(self._pallet_count / self._pallet_capacity) * 100
-                self.event_bus.emit("warehouse_pallet_count",{
-                    "count": self._pallet_count,
-                    "fill": fill_percentage})
+                self.event_bus.emit("warehouse_pallet_count", StockCount(
+                    count=self._pallet_count,
+                    fill=fill_percentage))
 
             log_manager.log(f"Stored empty pallet {pallet}",
                         component_id=self.__class__.__name__,
                         sim_time=self.env.now)
 
+    def snapshot_state(self, payloads: dict, orders: dict) -> dict:
+        """
+        Pallets already referenced in payloads (e.g. by the input buffer during storing)
+        are not stored twice.
+        """
+        store = []
+        for pallet in self._pallet_store.items:
+            if pallet.id not in payloads:
+                payloads[pallet.id] = pallet
+                store.append(pallet.id)
+
+        processing_order = None
+        if self._processing_order is not None:
+            orders[self._processing_order.id] = self._processing_order
+            processing_order = self._processing_order.id
+
+        return {"pallet_store": store,
+                "order_queue": self._queue_state(self._order_queue, orders),
+                "processing_order": processing_order}
+
+    def restore_state(self, state: dict, payloads: dict, orders: dict):
+        self._pallet_store.items[:] = [payloads[pallet_id] for pallet_id in state["pallet_store"]]
+        self._pallet_count = len(self._pallet_store.items)
+        self._order_queue = self._restore_queue(state["order_queue"], orders)
+        self._advance_counter(state["order_queue"])
+        processing_order = state["processing_order"]
+        self._processing_order = orders[processing_order] if processing_order is not None else None
+
     def inject_eventbus(self, event_bus: EventBus):
         self.event_bus = event_bus
         # Emit order and pallet count
         fill_percentage = math.ceil(self._pallet_count/self._pallet_capacity) * 100
-        self.event_bus.emit("warehouse_pallet_count",{
-            "count":self._pallet_count,
-            "fill":fill_percentage})
-        self.event_bus.emit("warehouse_order_count",{"count":len(self._order_queue)})
+        self.event_bus.emit("warehouse_pallet_count", StockCount(
+            count=self._pallet_count,
+            fill=fill_percentage))
+        self.event_bus.emit("warehouse_order_count", StockCount(count=len(self._order_queue)))
 
     def _order_loop(self):
         """Continuously monitor and process orders."""
         while True:
-            # Wait until there's at least one order in the queue
-            while not self._has_orders():
-                # Check periodically for new orders
-                yield self.env.timeout(0.5)
-
-            # Wait until output buffer is ready to accept new pallet
-            while not self._output_buffer.can_load():
-                yield self.env.timeout(0.5)
-
-            # Wait until a pallet becomes available in warehouse
-            while len(self._pallet_store.items) == 0:
-                # No pallets currently available — keep checking
-                yield self.env.timeout(0.5)
-
-            # Take a pallet from the store
-            pallet: SystemPallet = yield self._pallet_store.get()
-            log_manager.log(f"Took pallet {pallet} from storage",
-                        component_id=self.__class__.__name__,
-                        sim_time=self.env.now)
-
-            # Simulate loading pallet into buffer
-            yield self.env.timeout(PALLET_BUFFER_PROCESS_TIME)
-            self._pallet_count -= 1
-
-            # Process next available order
-            order = self._next_order()
-
-            if self.event_bus is not None:
-                self.event_bus.emit("dispatch_pallet", {"id": pallet.id})
-                pallets_available = math.ceil(
-                    self._pallet_count / WAREHOUSE_MAX_PALLET_CAPACITY * 100)
-                self.event_bus.emit("warehouse_pallet_count",{
-                    "count": self._pallet_count,
-                    "fill": pallets_available})
-                self.event_bus.emit("warehouse_order_count", {"count": len(self._order_queue)})
-
-            self._output_buffer.load(pallet)
+            # A pallet restored from a snapshot on the output buffer is finished first
+            restored = self._output_buffer is not None and self._output_buffer.payload is not None
+            if not restored:
+                # Wait until there's at least one order in the queue
+                while not self._has_orders():
+                    yield self._order_placed.wait()
+
+                # Wait until output buffer is ready to accept new pallet
+                while not self._output_buffer.can_load():
+                    yield self._output_buffer.wait_for_space()
+
+                # Take a pallet from the store, waits until one becomes available
+                pallet: SystemPallet = yield self._pallet_store.get()
+                log_manager.log(f"Took pallet {pallet} from storage",
+                            component_id=self.__class__.__name__,
+                            sim_time=self.env.now)
+
+                # Simulate loading pallet into buffer
+                yield self.env.timeout(PALLET_BUFFER_PROCESS_TIME)
+                self._pallet_count -= 1
+
+                # Process next available order
+                self._processing_order = self._next_order()
+
+                if self.event_bus is not None:
+                    self.event_bus.emit("dispatch_pallet", PayloadCreated(id=pallet.id))
+                    pallets_available = math.ceil(
+                        self._pallet_count / WAREHOUSE_MAX_PALLET_CAPACITY * 100)
+                    self.event_bus.emit("warehouse_pallet_count", StockCount(
+                        count=self._pallet_count,
+                        fill=pallets_available))
+                    self.event_bus.emit("warehouse_order_count", StockCount(count=len(self._order_queue)))
+
+                self._output_buffer.load(pallet)
 
             # Run order process
-            yield self.env.process(self.process_order(order))
+            if self._processing_order is not None:
+                yield self.env.process(self.process_order(self._processing_order))
+                self._processing_order = None
 
             # Trigger buffer handoff
             yield self.env.process(self._output_buffer.handoff())
@@ -0,0 +1,18 @@
+from enum import Enum
+
+
+class PalletState(Enum):
+    EMPTY = 0
+    REFILL_ORDER = 1
+    OPM_ORDER = 2
+
+# Registry for connecting pallet states to gui representations
+PALLET_ORDER_STATES = {
+    "Empty" : PalletState.EMPTY,
+    "RefillOrder" : PalletState.REFILL_ORDER,
+    "OpmOrder" : PalletState.OPM_ORDER
+}
+
+class BatchState(Enum):
+    BUILDING = 0
+    READY = 1
@@ -1,15 +1,60 @@
-from collections import defaultdict
-
 class EventBus:
     """
     Stateless service for signaling system state changes to other components.
+    Subscribers either listen to every event of a topic or only to events emitted with a given key,
+    e.g. the id of the component they visualize. Keyed events are dispatched with a single dict lookup.
+    Subscriber lists are compiled into tuples on subscribe so emitting allocates nothing.
+    Taps receive every emission of every topic, e.g. for recording a run.
     """
     def __init__(self):
-        self._subscribers = defaultdict(list)
+        self._subscribers: dict[str, tuple] = {}
+        self._keyed_subscribers: dict[str, dict[object, tuple]] = {}
+        self._taps: tuple = ()
+
+    def subscribe(self, event_type: str, callback, key=None):
+        """Subscribe to a topic. If key is given, only events emitted with the same key are received."""
+        if key is None:
+            self._subscribers[event_type] = self._subscribers.get(event_type, ()) + (callback,)
+        else:
+            keyed = self._keyed_subscribers.setdefault(event_type, {})
+            keyed[key] = keyed.get(key, ()) + (callback,)
+
+    def unsubscribe(self, event_type: str, callback, key=None):
+        if key is None:
+            callbacks = tuple(cb for cb in self._subscribers.get(event_type, ()) if cb != callback)
+            if callbacks:
+                self._subscribers[event_type] = callbacks
+            else:
+                self._subscribers.pop(event_type, None)
+        else:
+            keyed = self._keyed_subscribers.get(event_type, {})
+            callbacks = tuple(cb for cb in keyed.get(key, ()) if cb != callback)
+            if callbacks:
+                keyed[key] = callbacks
+            else:
+                keyed.pop(key, None)
+
+    def add_tap(self, callback):
+        """Receive every emission as callback(event_type, event, key)."""
+        self._taps = self._taps + (callback,)
+
+    def remove_tap(self, callback):
+        self._taps = tuple(tap for tap in self._taps if tap != callback)
 
-    def subscribe(self, event_type: str, callback):
-        self._subscribers[event_type].append(callback)
+    def has_subscribers(self, event_type: str, key=None) -> bool:
+        """Check if an emit would reach anyone. Lets hot paths skip building the event."""
+        if self._taps or event_type in self._subscribers:
+            return True
+        keyed = self._keyed_subscribers.get(event_type)
+        return bool(keyed) and (key is None or key in keyed)
 
-    def emit(self, event_type: str, data=None):
-        for callback in self._subscribers[event_type]:
-            callback(data)
\ No newline at end of file
+    def emit(self, event_type: str, event=None, key=None):
+        for tap in self._taps:
+            tap(event_type, event, key)
+        for callback in self._subscribers.get(event_type, ()):
+            callback(event)
+        if key is not None:
+            keyed = self._keyed_subscribers.get(event_type)
+            if keyed:
+                for callback in keyed.get(key, ()):
+                    callback(event)
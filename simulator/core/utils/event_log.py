@@ -0,0 +1,298 @@
+"""
+Recording and replay of EventBus emissions.
+
+Log format: an 8 byte magic header followed by frames of (kind: u8, length: u32, body).
+  STRING frame: u32 id + utf-8 text. Defines an interned string before its first use.
+  EVENT frame:  f64 sim time + u32 topic string id + encoded key + encoded event.
+Values are encoded with a one byte tag. Strings, enum classes and event classes are
+interned, so a typical move event takes around 50 bytes.
+"""
+import bisect
+import dataclasses
+import struct
+from enum import Enum
+from simulator.core.utils import events
+from simulator.core.utils.event_bus import EventBus
+from simulator.core.orders.order import OrderStatus
+from simulator.core.transportation_units.payload_state import PalletState, BatchState
+
+MAGIC = b"MFEVLOG\x01"
+
+_STRING = 0
+_EVENT = 1
+
+_FRAME = struct.Struct("<BI")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_EVENT_HEAD = struct.Struct("<dI")
+
+# Types that can be restored from a log
+EVENT_TYPES = {cls.__name__: cls for cls in vars(events).values()
+               if isinstance(cls, type) and dataclasses.is_dataclass(cls)}
+ENUM_TYPES = {cls.__name__: cls for cls in (OrderStatus, PalletState, BatchState)}
+
+
+class EventRecorder:
+    """
+    Taps an EventBus and appends every emission with its sim time to a binary log.
+
+    Attributes
+    ----------
+    env : simpy.Environment
+        Environment providing the sim time of the emissions.
+    path : str
+        Path of the log file. An existing file is overwritten.
+    recorded : int
+        Amount of events recorded.
+    """
+    def __init__(self, env, event_bus: EventBus, path: str):
+        self.env = env
+        self.event_bus = event_bus
+        self.path = path
+        self.recorded = 0
+        self._strings: dict[str, int] = {}
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self.event_bus.add_tap(self.record)
+
+    def record(self, topic: str, event, key=None):
+        body = bytearray(_EVENT_HEAD.pack(self.env.now, self._intern(topic)))
+        self._encode(body, key)
+        self._encode(body, event)
+        self._file.write(_FRAME.pack(_EVENT, len(body)))
+        self._file.write(body)
+        self.recorded += 1
+
+    def flush(self):
+        self._file.flush()
+
+    def close(self):
+        """Stop recording and close the log."""
+        if self._file.closed:
+            return
+        self.event_bus.remove_tap(self.record)
+        self._file.close()
+
+    def _intern(self, text: str) -> int:
+        string_id = self._strings.get(text)
+        if string_id is None:
+            string_id = self._strings[text] = len(self._strings)
+            data = text.encode("utf-8")
+            self._file.write(_FRAME.pack(_STRING, _U32.size + len(data)))
+            self._file.write(_U32.pack(string_id))
+            self._file.write(data)
+        return string_id
+
+    def _encode(self, out: bytearray, value):
+        if value is None:
+            out += b"N"
+        elif value is True:
+            out += b"T"
+        elif value is False:
+            out += b"F"
+        elif isinstance(value, Enum): # Before str, OrderStatus is a str enum
+            out += b"E" + _U32.pack(self._intern(type(value).__name__))
+            self._encode(out, value.value)
+        elif isinstance(value, int):
+            out += b"i" + _I64.pack(value)
+        elif isinstance(value, float):
+            out += b"f" + _F64.pack(value)
+        elif isinstance(value, str):
+            out += b"S" + _U32.pack(self._intern(value))
+        elif isinstance(value, (tuple, list)):
+            out += b"t" + _U32.pack(len(value))
+            for element in value:
+                self._encode(out, element)
+        elif isinstance(value, dict):
+            out += b"d" + _U32.pack(len(value))
+            for k, v in value.items():
+                self._encode(out, k)
+                self._encode(out, v)
+        elif type(value).__name__ in EVENT_TYPES:
+            fields = value.__slots__
+            out += b"O" + _U32.pack(self._intern(type(value).__name__))
+            for field in fields:
+                self._encode(out, getattr(value, field))
+        else:
+            raise TypeError(f"Cannot record value of type {type(value).__name__}")
+
+
+class EventLog:
+    """
+    Read-only view of a recorded log. The file is indexed once on open,
+    after which any event can be decoded directly by its index.
+
+    Attributes
+    ----------
+    path : str
+        Path of the log file.
+    times : list[float]
+        Sim time of every event, in recording order.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as file:
+            self._data = file.read()
+        if not self._data.startswith(MAGIC):
+            raise ValueError(f"{path} is not an event log")
+
+        self._strings: list[str] = []
+        self._offsets: list[int] = []
+        self.times: list[float] = []
+        self._index()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def _index(self):
+        data = self._data
+        offset = len(MAGIC)
+        while offset + _FRAME.size <= len(data):
+            kind, length = _FRAME.unpack_from(data, offset)
+            body = offset + _FRAME.size
+            if body + length > len(data):
+                break # Truncated tail of a run that did not close the log
+            if kind == _STRING:
+                string_id, = _U32.unpack_from(data, body)
+                assert string_id == len(self._strings)
+                self._strings.append(data[body + _U32.size:body + length].decode("utf-8"))
+            elif kind == _EVENT:
+                self._offsets.append(body)
+                self.times.append(_F64.unpack_from(data, body)[0])
+            offset = body + length
+
+    def index_at(self, sim_time: float) -> int:
+        """Index of the first event recorded after the given sim time."""
+        return bisect.bisect_right(self.times, sim_time)
+
+    def read(self, index: int) -> tuple[float, str, object, object]:
+        """Decode the event at index. Return (sim_time, topic, key, event)."""
+        sim_time, topic_id = _EVENT_HEAD.unpack_from(self._data, self._offsets[index])
+        offset = self._offsets[index] + _EVENT_HEAD.size
+        key, offset = self._decode(offset)
+        event, offset = self._decode(offset)
+        return sim_time, self._strings[topic_id], key, event
+
+    def _decode(self, offset: int):
+        data = self._data
+        tag = data[offset:offset + 1]
+        offset += 1
+        if tag == b"N":
+            return None, offset
+        if tag == b"T":
+            return True, offset
+        if tag == b"F":
+            return False, offset
+        if tag == b"i":
+            return _I64.unpack_from(data, offset)[0], offset + _I64.size
+        if tag == b"f":
+            return _F64.unpack_from(data, offset)[0], offset + _F64.size
+        if tag == b"S":
+            return self._strings[_U32.unpack_from(data, offset)[0]], offset + _U32.size
+        if tag == b"E":
+            enum_type = ENUM_TYPES[self._strings[_U32.unpack_from(data, offset)[0]]]
+            value, offset = self._decode(offset + _U32.size)
+            return enum_type(value), offset
+        if tag == b"t":
+            length, = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            values = []
+            for _ in range(length):
+                value, offset = self._decode(offset)
+                values.append(value)
+            return tuple(values), offset
+        if tag == b"d":
+            length, = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            result = {}
+            for _ in range(length):
+                key, offset = self._decode(offset)
+                result[key], offset = self._decode(offset)
+            return result, offset
+        if tag == b"O":
+            event_type = EVENT_TYPES[self._strings[_U32.unpack_from(data, offset)[0]]]
+            offset += _U32.size
+            values = []
+            for _ in event_type.__slots__:
+                value, offset = self._decode(offset)
+                values.append(value)
+            return event_type(*values), offset
+        raise ValueError(f"Corrupt event log at offset {offset - 1}")
+
+
+class EventReplayer:
+    """
+    Re-emits a recorded log onto an EventBus without running SimPy.
+    Exposes 'now', 'run(until)' and 'peek()' like simpy.Environment,
+    so it can drive SimulationController in place of the environment.
+    Jumping backwards emits 'replay_reset' and replays from the start.
+
+    Attributes
+    ----------
+    log : EventLog
+        The recorded log.
+    event_bus : EventBus
+        Bus to replay the events into.
+    now : float
+        Current replay time.
+    """
+    def __init__(self, log: EventLog, event_bus: EventBus):
+        self.log = log
+        self.event_bus = event_bus
+        self.now = 0.0
+        self._position = 0
+
+    # ----------
+    # Properties
+    # ----------
+
+    @property
+    def position(self) -> int:
+        """Index of the next event to emit."""
+        return self._position
+
+    @property
+    def end_time(self) -> float:
+        return self.log.times[-1] if len(self.log) else 0.0
+
+    # ---------
+    # Replaying
+    # ---------
+
+    def peek(self) -> float:
+        """Time of the next event, 'inf' at the end of the log."""
+        if self._position >= len(self.log):
+            return float('inf')
+        return self.log.times[self._position]
+
+    def fast_forward(self, until: float) -> int:
+        """Emit every event up to and including the given sim time. Return the amount emitted."""
+        end = self.log.index_at(until)
+        emit = self.event_bus.emit
+        for index in range(self._position, end):
+            _, topic, key, event = self.log.read(index)
+            emit(topic, event, key=key)
+        emitted = max(0, end - self._position)
+        self._position = max(self._position, end)
+        self.now = max(self.now, until)
+        return emitted
+
+    def run(self, until: float | None = None):
+        self.fast_forward(self.end_time if until is None else until)
+
+    def step(self):
+        """Emit the next event."""
+        if self._position < len(self.log):
+            _, topic, key, event = self.log.read(self._position)
+            self.now = self.log.times[self._position]
+            self._position += 1
+            self.event_bus.emit(topic, event, key=key)
+
+    def seek(self, sim_time: float) -> int:
+        """Move replay to the given sim time. Return the amount of events emitted."""
+        if sim_time < self.now:
+            self._position = 0
+            self.now = 0.0
+            self.event_bus.emit("replay_reset", events.ReplayReset(sim_time=sim_time))
+        return self.fast_forward(sim_time)
@@ -0,0 +1,129 @@
+"""
+Event objects carried by the EventBus.
+Plain slotted dataclasses: cheap to create, attribute access instead of dict lookups.
+"""
+from dataclasses import dataclass
+from typing import Any
+
+
+# ---------------
+# Master data
+# ---------------
+
+@dataclass(slots=True)
+class ItemCreated:
+    """Topic: 'create_item'"""
+    item_id: int
+    name: str
+    weight: float
+    category: str
+    volume: float
+    stackable: bool
+
+
+# ---------------
+# Payloads
+# ---------------
+
+@dataclass(slots=True)
+class PalletCreated:
+    """Topic: 'create_pallet'"""
+    pallet_id: int
+    location: str
+    sim_time: float
+
+
+@dataclass(slots=True)
+class PayloadMoved:
+    """Topic: 'move_payload', keyed by the component the payload moved on."""
+    id: int
+    type: str
+    location: str
+    sim_time: float
+    coords: tuple[int, int]
+    component_id: str
+
+
+@dataclass(slots=True)
+class PayloadUpdated:
+    """Topic: 'update_payload'"""
+    id: int
+    state: Any
+    type: str | None = None
+    order_id: int | None = None
+    destination: str | None = None
+    sim_time: float | None = None
+
+
+@dataclass(slots=True)
+class PayloadStored:
+    """Topic: 'store_payload'"""
+    id: int
+    type: str | None = None
+    location: str | None = None
+    sim_time: float | None = None
+
+
+@dataclass(slots=True)
+class PayloadCreated:
+    """Topics: 'dispatch_pallet', 'create_batch'"""
+    id: int
+
+
+# ---------------
+# Orders
+# ---------------
+
+@dataclass(slots=True)
+class OrderCreated:
+    """Topic: 'create_order'"""
+    order_id: int
+    order_time: float
+    type: str
+    item_id: int | None = None
+    qty: int | None = None
+    items: dict[int, int] | None = None
+
+
+@dataclass(slots=True)
+class OrderUpdated:
+    """Topic: 'update_order'"""
+    order_id: int
+    status: Any
+    completion_time: float | None = None
+
+
+# ---------------
+# Components and stock
+# ---------------
+
+@dataclass(slots=True)
+class ComponentStateChanged:
+    """
+    Topics: 'depalletizer_operating', 'depalletizer_idle',
+    'batch_builder_building', 'batch_builder_idle'. Keyed by component id.
+    """
+    id: str
+
+
+@dataclass(slots=True)
+class StockCount:
+    """
+    Topics: 'warehouse_pallet_count', 'warehouse_order_count',
+    'item_warehouse_item_count', 'item_warehouse_order_count'.
+    Fill percentage is only given for stock counts.
+    """
+    count: int
+    fill: int | None = None
+
+
+@dataclass(slots=True)
+class SimulationStopped:
+    """Topic: 'simulation_stopped'"""
+    sim_time: float
+
+
+@dataclass(slots=True)
+class ReplayReset:
+    """Topic: 'replay_reset'. Replay jumped backwards, consumers should drop their state."""
+    sim_time: float
@@ -1,9 +1,27 @@
 import random
 
 class IDGenerator:
-    def __init__(self):
+    def __init__(self, seed: int | None = None):
         # Store generated IDs to prevent duplicates
         self.generated_ids = set()
+        self._rng = random.Random(seed)
+
+    def reset(self, seed: int | None = None):
+        """Forget issued IDs and reseed. Used to isolate consecutive simulation runs."""
+        self.generated_ids.clear()
+        self._rng.seed(seed)
+
+    def get_state(self) -> dict:
+        """Return the issued IDs and the random state in a JSON serializable form."""
+        version, internal_state, gauss_next = self._rng.getstate()
+        return {"generated_ids": sorted(self.generated_ids),
+                "rng_state": [version, list(internal_state), gauss_next]}
+
+    def set_state(self, state: dict):
+        """Restore a state returned by get_state."""
+        version, internal_state, gauss_next = state["rng_state"]
+        self.generated_ids = set(state["generated_ids"])
+        self._rng.setstate((version, tuple(internal_state), gauss_next))
 
     def generate_id(self, type_digit: int, length: int) -> int:
         if type_digit < 1 or type_digit > 9:
@@ -19,11 +37,11 @@ class IDGenerator:
             # max random value with that many digits
             max_value = 10 ** remaining_digits - 1
 
-            random_digits = random.randint(0, max_value)
+            random_digits = self._rng.randint(0, max_value)
 
             # zero-pad the random part
             new_id = int(f"{type_digit}{random_digits:0{remaining_digits}d}")
 
             if new_id not in self.generated_ids:
                 self.generated_ids.add(new_id)
-                return new_id
\ No newline at end of file
+                return new_id
@@ -78,6 +78,10 @@ class LogManager:
 
         self.sim_logger.log(level, message, extra=extra)
 
+    def clear(self):
+        """Drop all stored log records. Used to isolate consecutive simulation runs."""
+        self.all_logs.clear()
+
     def get_unique_component_ids(self) -> list[str]:
         """
         Scans all stored log records and returns a sorted list of unique
@@ -0,0 +1,29 @@
+import simpy
+
+
+class Notifier:
+    """
+    Re-armable wake-up notification for processes waiting on a state change.
+    Waiting processes share one pending event that is fired by notify().
+    Costs no scheduled events while nobody is waiting.
+
+    Attributes
+    ----------
+    env : simpy.Environment
+        Simulation environment.
+    """
+    def __init__(self, env: simpy.Environment):
+        self.env = env
+        self._event: simpy.Event | None = None
+
+    def wait(self) -> simpy.Event:
+        """Return an event that gets triggered on the next notify()."""
+        if self._event is None:
+            self._event = self.env.event()
+        return self._event
+
+    def notify(self, value=None):
+        """Wake up every process currently waiting."""
+        if self._event is not None:
+            event, self._event = self._event, None
+            event.succeed(value)
@@ -0,0 +1,123 @@
+import queue
+import threading
+from simulator.core.utils.event_bus import EventBus
+from simulator.database.database_listener import DatabaseListener
+from simulator.database.database_manager import DatabaseManager
+from simulator.config import DB_WRITER_QUEUE_SIZE, DB_FLUSH_BATCH_SIZE, DB_FLUSH_SIM_INTERVAL
+import logging
+logger = logging.getLogger(__name__)
+
+# Queue control markers
+_SHUTDOWN = object()
+
+class _FlushRequest:
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class BackgroundWriter:
+    """
+    Persists simulation events on a dedicated writer thread.
+    Events are put onto a bounded queue on the simulation thread and drained by the writer,
+    which owns its own engine and feeds a DatabaseListener on a private event bus.
+    When the queue is full, submitting blocks until the writer catches up (backpressure).
+    The database has to be file based so that both threads see the same data.
+
+    Attributes
+    ----------
+    db_url : str
+        SQLAlchemy URL of the database to write into.
+    db_manager : DatabaseManager
+        Writer-side database manager. Used only from the writer thread.
+    """
+    TOPICS = ("create_item", "create_pallet", "update_payload", "store_payload",
+              "move_payload", "create_order", "update_order", "simulation_stopped")
+
+    def __init__(self, db_url: str,
+                 maxsize: int = DB_WRITER_QUEUE_SIZE,
+                 batch_size: int = DB_FLUSH_BATCH_SIZE,
+                 sim_interval: float = DB_FLUSH_SIM_INTERVAL):
+        if db_url.startswith("sqlite") and (":memory:" in db_url or db_url.rstrip("/") == "sqlite:"):
+            raise ValueError("BackgroundWriter requires a file based database")
+        self.db_url = db_url
+        self.db_manager = DatabaseManager(db_url)
+
+        # Writer side listener is only ever touched from the writer thread
+        self._bus = EventBus()
+        self._listener = DatabaseListener(self._bus, self.db_manager,
+                                          batch_size=batch_size, sim_interval=sim_interval)
+        self._listener.setup_subscriptions()
+
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._closed = False
+        self._thread.start()
+
+    def setup_subscriptions(self, event_bus: EventBus, db_manager: DatabaseManager | None = None):
+        """
+        Forward persisted topics from the simulation event bus to the writer.
+        If the reading side database manager is given, its queries wait for pending writes first.
+        """
+        for topic in self.TOPICS:
+            event_bus.subscribe(topic, lambda event, topic=topic: self.submit(topic, event))
+        if db_manager is not None:
+            db_manager.register_flush_hook(self.flush)
+
+    # ----------
+    # Properties
+    # ----------
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    @property
+    def queued(self) -> int:
+        """Approximate amount of events waiting for the writer."""
+        return self._queue.qsize()
+
+    # --------------
+    # Thread control
+    # --------------
+
+    def submit(self, topic: str, event):
+        """Queue an event for the writer. Blocks while the queue is full."""
+        if self._closed:
+            return
+        # Event objects are created per emit and never mutated afterwards, no copy needed
+        self._queue.put((topic, event))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until everything submitted so far has been written. Return False on timeout."""
+        if self._closed or not self._thread.is_alive():
+            return True
+        request = _FlushRequest()
+        self._queue.put(request)
+        return request.done.wait(timeout)
+
+    def close(self, timeout: float | None = None):
+        """Write out pending events and stop the writer thread."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread.is_alive():
+            self._queue.put(_SHUTDOWN)
+            self._thread.join(timeout)
+        self.db_manager.engine.dispose()
+
+    def _run(self):
+        while True:
+            message = self._queue.get()
+            try:
+                if message is _SHUTDOWN or isinstance(message, _FlushRequest):
+                    self._listener.flush()
+                else:
+                    topic, event = message
+                    self._bus.emit(topic, event)
+            except Exception as e:
+                logger.error("Background writer failed to persist an event.", exc_info=True)
+            finally:
+                if isinstance(message, _FlushRequest):
+                    message.done.set()
+            if message is _SHUTDOWN:
+                return
@@ -1,12 +1,46 @@
-from simulator.core.orders.order import OrderStatus
 from simulator.database.database_manager import DatabaseManager
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import (ItemCreated, PalletCreated, PayloadUpdated, PayloadStored,
+                                         PayloadMoved, OrderCreated, OrderUpdated)
+from simulator.config import DB_FLUSH_BATCH_SIZE, DB_FLUSH_SIM_INTERVAL
 
 class DatabaseListener:
-    """Listens for simulation events and persists them to the database"""
-    def __init__(self, event_bus: EventBus, db_manager: DatabaseManager):
+    """
+    Listens for simulation events and persists them to the database.
+    Writes are buffered and flushed in a single transaction every 'batch_size' events
+    or once 'sim_interval' of sim time has passed since the previous flush.
+    Repeated updates to the same record inside a window are coalesced into one row.
+    The buffer is also flushed when the simulation is stopped and before every database query.
+
+    Attributes
+    ----------
+    event_bus : EventBus
+        Event bus to listen to.
+    db_manager : DatabaseManager
+        Database to persist into.
+    batch_size : int
+        Amount of buffered events that triggers a flush.
+    sim_interval : float
+        Sim time window after which a flush is triggered.
+    """
+    def __init__(self, event_bus: EventBus, db_manager: DatabaseManager,
+                 batch_size: int = DB_FLUSH_BATCH_SIZE,
+                 sim_interval: float = DB_FLUSH_SIM_INTERVAL):
         self.event_bus = event_bus
         self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.sim_interval = sim_interval
+
+        # Write-behind buffers keyed by record id
+        self._items: dict[int, dict] = {}
+        self._pallets: dict[int, dict] = {}
+        self._refill_orders: dict[int, dict] = {}
+        self._opm_orders: dict[int, dict] = {}
+        self._pallet_updates: dict[int, dict] = {}
+        self._order_updates: dict[int, dict] = {}
+
+        self._buffered_events = 0
+        self._window_start: float | None = None
 
     def setup_subscriptions(self):
         """Subscribe to relevant events from the simulation."""
@@ -17,88 +51,144 @@ class DatabaseListener:
         self.event_bus.subscribe("create_item", self.on_item_created)
         self.event_bus.subscribe("create_order", self.on_order_created)
         self.event_bus.subscribe("update_order", self.on_order_updated)
+        self.event_bus.subscribe("simulation_stopped", self.on_simulation_stopped)
+        self.db_manager.register_flush_hook(self.flush)
+
+    # ----------
+    # Properties
+    # ----------
 
+    @property
+    def pending(self) -> int:
+        """Amount of buffered events not yet written."""
+        return self._buffered_events
+
+    # ---------
+    # Buffering
+    # ---------
+
+    def flush(self):
+        """Write every buffered insert and update in one transaction."""
+        if self._buffered_events == 0:
+            return
+        items, self._items = self._items, {}
+        pallets, self._pallets = self._pallets, {}
+        refill_orders, self._refill_orders = self._refill_orders, {}
+        opm_orders, self._opm_orders = self._opm_orders, {}
+        pallet_updates, self._pallet_updates = self._pallet_updates, {}
+        order_updates, self._order_updates = self._order_updates, {}
+        self._buffered_events = 0
+        self._window_start = None
+
+        self.db_manager.write_batch(items=items, pallets=pallets,
+                                    refill_orders=refill_orders, opm_orders=opm_orders,
+                                    pallet_updates=pallet_updates, order_updates=order_updates)
+
+    def _buffered(self, sim_time: float | None = None):
+        """Count a buffered event and flush if the batch or the sim time window is full."""
+        self._buffered_events += 1
+        if sim_time is not None and self._window_start is None:
+            self._window_start = sim_time
+
+        if self._buffered_events >= self.batch_size:
+            self.flush()
+        elif sim_time is not None and sim_time - self._window_start >= self.sim_interval:
+            self.flush()
+
+    def _update_pallet(self, pallet_id: int, sim_time: float, **values):
+        values["last_updated_sim_time"] = sim_time
+        if pallet_id in self._pallets:
+            # Not yet written, fold the update into the pending insert
+            self._pallets[pallet_id].update(values)
+        else:
+            self._pallet_updates.setdefault(pallet_id, {}).update(values)
+        self._buffered(sim_time)
 
     # --------------
     # Event handlers
     # --------------
 
-    def on_item_created(self, data: dict):
-        self.db_manager.insert_item(
-            item_id=data['item_id'],
-            name=data['name'],
-            weight=data['weight'],
-            category=data['category'],
-            volume=data['volume'],
-            stackable=data['stackable']
+    def on_item_created(self, event: ItemCreated):
+        self._items[event.item_id] = dict(
+            name=event.name,
+            weight=event.weight,
+            category=event.category,
+            volume=event.volume,
+            stackable=event.stackable
         )
+        self._buffered()
 
-    def on_pallet_created(self, data: dict):
-        self.db_manager.insert_pallet(
-            pallet_id=data['pallet_id'],
-            location=data['location'],
-            sim_time=data['sim_time']
+    def on_pallet_created(self, event: PalletCreated):
+        self._pallets[event.pallet_id] = dict(
+            location=event.location,
+            last_updated_sim_time=event.sim_time
         )
+        self._buffered(event.sim_time)
 
-    def on_pallet_updated(self, data: dict):
-        if data.get("type") != "SystemPallet":
+    def on_pallet_updated(self, event: PayloadUpdated):
+        if event.type != "SystemPallet":
             # Assert we only update data if type is SystemPallet
             return
-        self.db_manager.update_pallet(
-            pallet_id=data['id'],
-            sim_time=data['sim_time'],
-            order_id=data.get('order_id'),
-            destination=data.get('destination'),
+        self._update_pallet(
+            event.id,
+            event.sim_time,
+            order_id=event.order_id,
+            destination=event.destination,
             stored=False
         )
 
-    def on_pallet_stored(self, data: dict):
-        if data.get("type") != "SystemPallet":
+    def on_pallet_stored(self, event: PayloadStored):
+        if event.type != "SystemPallet":
             return
 
-        self.db_manager.update_pallet(
-            pallet_id=data['id'],
-            sim_time=data['sim_time'],
-            location=data.get('location'),
+        self._update_pallet(
+            event.id,
+            event.sim_time,
+            location=event.location,
             destination=None,
             stored=True
         )
 
-    def on_pallet_moved(self, data: dict):
-        if data.get("type") != "SystemPallet":
+    def on_pallet_moved(self, event: PayloadMoved):
+        if event.type != "SystemPallet":
             return
 
-        self.db_manager.update_pallet(
-            pallet_id=data['id'],
-            sim_time=data['sim_time'],
-            location=data.get('location'),
+        self._update_pallet(
+            event.id,
+            event.sim_time,
+            location=event.location,
         )
 
-    def on_order_created(self, data: dict):
-        type = data.get("type")
+    def on_order_created(self, event: OrderCreated):
+        type = event.type
         if type != "RefillOrder" and type != "OpmOrder":
             return
 
-        order_id=data['order_id']
-        order_time = data['order_time']
+        order_id=event.order_id
+        order_time = event.order_time
 
         if type == "RefillOrder":
-            self.db_manager.insert_refill_order(
-                order_id=order_id,
+            self._refill_orders[order_id] = dict(
                 order_time=order_time,
-                item_id=data['item_id'],
-                qty=data['qty']
+                item_id=event.item_id,
+                qty=event.qty
             )
         elif type == "OpmOrder":
-            self.db_manager.insert_opm_order(
-                order_id=order_id,
+            self._opm_orders[order_id] = dict(
                 order_time=order_time,
-                items=data['items']
+                items=dict(event.items)
             )
+        self._buffered(order_time)
 
-    def on_order_updated(self, data: dict):
-        self.db_manager.update_order(
-            order_id=data['order_id'],
-            status=data.get('status'),
-            completion_time=data.get('completion_time')
-        )
+    def on_order_updated(self, event: OrderUpdated):
+        order_id = event.order_id
+        values = dict(status=event.status, completion_time=event.completion_time)
+        pending_insert = self._refill_orders.get(order_id) or self._opm_orders.get(order_id)
+        if pending_insert is not None:
+            pending_insert.update(values)
+        else:
+            self._order_updates.setdefault(order_id, {}).update(values)
+        self._buffered()
+
+    def on_simulation_stopped(self, event=None):
+        self.flush()
@@ -1,6 +1,7 @@
 import sqlalchemy
 from sqlalchemy.orm import sessionmaker
 from simulator.database.models import Base, Pallet, Order, RefillOrder, OpmOrder, Item, OrderStatus
+from simulator.config import DB_PROFILE, DB_PROFILES
 import os
 import logging
 logger = logging.getLogger(__name__)
@@ -16,16 +17,29 @@ db_url = f"sqlite:///{db_path}"
 class DatabaseManager:
     """
     Manages the database connection, session, and provides an API for database operations.
+    For SQLite, the pragmas of the given profile in DB_PROFILES are applied on every new connection.
     """
-    def __init__(self, db_url: str = db_url):
+    def __init__(self, db_url: str = db_url, profile: str = DB_PROFILE):
         try:
             self.engine = sqlalchemy.create_engine(db_url)
             self.Session = sessionmaker(bind=self.engine)
-            logger.info(f"DatabaseManager initialized with engine for URL: {db_url}")
+            self._flush_hooks = []
+            self.pragmas = DB_PROFILES[profile]
+            if self.engine.dialect.name == "sqlite" and self.pragmas:
+                sqlalchemy.event.listen(self.engine, "connect", self._apply_pragmas)
+            logger.info(f"DatabaseManager initialized with engine for URL: {db_url} (profile: {profile})")
         except Exception as e:
             logger.critical("Failed to initialize DatabaseManager engine.", exc_info=True)
             raise  # Re-raise the exception to stop the application if the DB can't be set up
 
+    def _apply_pragmas(self, dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma, value in self.pragmas.items():
+                cursor.execute(f"PRAGMA {pragma}={value}")
+        finally:
+            cursor.close()
+
     def setup_database(self, fresh_start: bool = True):
         """Creates all tables. If fresh_start, it drops all existing tables first."""
         try:
@@ -40,6 +54,87 @@ class DatabaseManager:
             logger.critical("Failed to setup database tables.", exc_info=True)
             raise
 
+    def register_flush_hook(self, hook):
+        """Register a callable that writes out buffered data. Hooks are run before every query."""
+        self._flush_hooks.append(hook)
+
+    def _run_flush_hooks(self):
+        for hook in self._flush_hooks:
+            hook()
+
+    # ----------------
+    # Batch operations
+    # ----------------
+
+    def write_batch(self, items: dict[int, dict] = None, pallets: dict[int, dict] = None,
+                    refill_orders: dict[int, dict] = None, opm_orders: dict[int, dict] = None,
+                    pallet_updates: dict[int, dict] = None, order_updates: dict[int, dict] = None):
+        """
+        Write buffered inserts and updates in a single transaction, rolling back on error.
+        Every argument maps a record id to its column values.
+        Inserts of already existing ids are skipped, updates of non-existent ids are ignored.
+        """
+        session = self.Session()
+        try:
+            # Inserts first so that updates in the same batch can target them
+            session.add_all(
+                Item(id=item_id, **values)
+                for item_id, values in self._new_rows(session, Item, items).items())
+            session.add_all(
+                Pallet(id=pallet_id, **values)
+                for pallet_id, values in self._new_rows(session, Pallet, pallets).items())
+            session.add_all(
+                RefillOrder(id=order_id, **values)
+                for order_id, values in self._new_rows(session, Order, refill_orders).items())
+            session.add_all(
+                OpmOrder(id=order_id, **values)
+                for order_id, values in self._new_rows(session, Order, opm_orders).items())
+            session.flush()
+
+            self._bulk_update(session, Pallet, pallet_updates)
+            self._bulk_update(session, Order, order_updates)
+            session.commit()
+        except Exception as e:
+            logger.error("Failed to write database batch.", exc_info=True)
+            session.rollback()
+        finally:
+            session.close()
+
+    @staticmethod
+    def _existing_ids(session, model, ids) -> set[int]:
+        if not ids:
+            return set()
+        return set(session.scalars(sqlalchemy.select(model.id).where(model.id.in_(ids))))
+
+    def _new_rows(self, session, model, rows: dict[int, dict] | None) -> dict[int, dict]:
+        """Drop rows whose id already exists in the table."""
+        if not rows:
+            return {}
+        existing = self._existing_ids(session, model, list(rows))
+        if existing:
+            logger.debug(f"Skipping duplicate {model.__name__} insertion for IDs {sorted(existing)}.")
+        return {row_id: values for row_id, values in rows.items() if row_id not in existing}
+
+    def _bulk_update(self, session, model, updates: dict[int, dict] | None):
+        """Update existing rows by primary key with one executemany per set of columns."""
+        if not updates:
+            return
+        existing = self._existing_ids(session, model, list(updates))
+        params = []
+        for row_id, values in updates.items():
+            if row_id not in existing:
+                logger.warning(f"Cannot update non-existent {model.__name__.lower()} '{row_id}'.")
+                continue
+            row = {"id": row_id}
+            for key, value in values.items():
+                if hasattr(model, key):
+                    row[key] = value
+                else:
+                    logger.warning(f"Ignoring unknown attribute '{key}' for {model.__name__} update.")
+            params.append(row)
+        if params:
+            session.execute(sqlalchemy.update(model), params)
+
     # ---------------
     # Item operations
     # ---------------
@@ -66,6 +161,7 @@ class DatabaseManager:
 
     def get_all_item_categories(self) -> list[str]:
         """Helper function to get a unique, sorted list of all item categories."""
+        self._run_flush_hooks()
         with self.Session() as session:
             try:
                 categories = session.query(Item.category).distinct().order_by(Item.category).all()
@@ -78,6 +174,7 @@ class DatabaseManager:
         """
         A flexible method to query the items table with dynamic filters.
         """
+        self._run_flush_hooks()
         with self.Session() as session:
             try:
                 query = session.query(Item)
@@ -165,6 +262,7 @@ class DatabaseManager:
         """
         A flexible method to query the pallets table with dynamic filters.
         """
+        self._run_flush_hooks()
         with self.Session() as session:
             try:
                 query = session.query(Pallet)
@@ -271,6 +369,7 @@ class DatabaseManager:
         """
         A flexible method to query the orders table with dynamic filters.
         """
+        self._run_flush_hooks()
         with self.Session() as session:
             try:
                 # Start with a base query on the polymorphic Order class
@@ -1,5 +1,5 @@
 import sqlalchemy
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from simulator.core.orders.order import OrderStatus
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, attribute_mapped_collection
 from sqlalchemy.ext.associationproxy import association_proxy
@@ -20,7 +20,7 @@ class Item(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(sqlalchemy.String(100), unique=True, nullable=False)
     weight: Mapped[float] = mapped_column(sqlalchemy.Float, nullable=False)
-    category: Mapped[str] = mapped_column(sqlalchemy.String(50), nullable=False)
+    category: Mapped[str] = mapped_column(sqlalchemy.String(50), nullable=False, index=True)
     volume: Mapped[float] = mapped_column(sqlalchemy.Float, nullable=False)
     stackable: Mapped[bool] = mapped_column(sqlalchemy.Boolean, nullable=False)
 
@@ -32,14 +32,17 @@ class Order(Base):
 
     # Columns common to all orders
     id: Mapped[int] = mapped_column(primary_key=True)
-    type: Mapped[str] = mapped_column(sqlalchemy.String) # Discriminator column
-    order_time: Mapped[float] = mapped_column(sqlalchemy.Float)
+    type: Mapped[str] = mapped_column(sqlalchemy.String, index=True) # Discriminator column
+    order_time: Mapped[float] = mapped_column(sqlalchemy.Float, index=True)
     completion_time: Mapped[float] = mapped_column(sqlalchemy.Float, nullable=True, default=None)
     status: Mapped[OrderStatus] = mapped_column(sqlalchemy.Enum(OrderStatus,
             name="orderstatus",
             values_callable=lambda obj: [e.value for e in obj],
             native_enum=False), default=OrderStatus.PENDING)
 
+    # Order query widget filters by status and sorts by order time
+    __table_args__ = (Index("ix_orders_status_order_time", "status", "order_time"),)
+
     # Inheritance Settings
     __mapper_args__ = {
         'polymorphic_on': 'type',
@@ -109,3 +112,6 @@ class Pallet(Base):
     order_id: Mapped[int] = mapped_column(sqlalchemy.Integer, nullable=True, default=None)
     stored: Mapped[bool] = mapped_column(sqlalchemy.Boolean, nullable=False, default=True)
     last_updated_sim_time: Mapped[float] = mapped_column(sqlalchemy.Float, nullable=False)
+
+    # Active pallet view filters by stored and sorts by last update
+    __table_args__ = (Index("ix_pallets_stored_last_updated", "stored", "last_updated_sim_time"),)
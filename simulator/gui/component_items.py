@@ -1,8 +1,9 @@
-from enum import Enum
 from PyQt6.QtWidgets import QGraphicsItem
 from PyQt6.QtGui import QBrush, QColor, QPen, QPolygonF, QFont, QFontMetrics
 from PyQt6.QtCore import QRectF, Qt, QPointF
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import ComponentStateChanged, StockCount
+from simulator.core.transportation_units.payload_state import PalletState, BatchState, PALLET_ORDER_STATES
 from abc import abstractmethod
 
 # -------------
@@ -40,18 +41,6 @@ class BasePayloadItem(QGraphicsItem):
         pass
 
 
-class PalletState(Enum):
-    EMPTY = 0
-    REFILL_ORDER = 1
-    OPM_ORDER = 2
-
-# Registry for connecting pallet states to gui representations
-PALLET_ORDER_STATES = {
-    "Empty" : PalletState.EMPTY,
-    "RefillOrder" : PalletState.REFILL_ORDER,
-    "OpmOrder" : PalletState.OPM_ORDER
-}
-
 class PalletItem(BasePayloadItem):
     """
     Pallets are modelled as 60x60 rectangles.
@@ -72,10 +61,6 @@ class PalletItem(BasePayloadItem):
             self.color = QColor("orange")
 
 
-class BatchState(Enum):
-    BUILDING = 0
-    READY = 1
-
 class BatchItem(BasePayloadItem):
     """
     A 50x50 rectangle that has 2 states: in progress (building) and ready.
@@ -254,22 +239,20 @@ class DepalletizerItem(BaseComponentItem):
         self.operating = False
 
         # Subscribe to events
-        self.event_bus.subscribe("depalletizer_operating", self.on_operating)
-        self.event_bus.subscribe("depalletizer_idle", self.on_idle)
+        self.event_bus.subscribe("depalletizer_operating", self.on_operating, key=self.id)
+        self.event_bus.subscribe("depalletizer_idle", self.on_idle, key=self.id)
 
-    def on_operating(self, payload):
+    def on_operating(self, event: ComponentStateChanged):
         """Called when the depalletizer starts working."""
-        if payload.get("id") == self.id:
-            self.operating = True
-            self.color = QColor("#FFA500")  # orange = operating
-            self.update()
+        self.operating = True
+        self.color = QColor("#FFA500")  # orange = operating
+        self.update()
 
-    def on_idle(self, payload):
+    def on_idle(self, event: ComponentStateChanged):
         """Called when the depalletizer stops."""
-        if payload.get("id") == self.id:
-            self.operating = False
-            self.color = QColor("#808080")  # gray = idle
-            self.update()
+        self.operating = False
+        self.color = QColor("#808080")  # gray = idle
+        self.update()
 
     def paint(self, painter, option, widget=None):
         # Draw the outer 100x100 depalletizer
@@ -300,22 +283,20 @@ class BatchBuilderItem(BaseComponentItem):
         self.border_thickness = 2
 
         # Subscribe to events
-        self.event_bus.subscribe("batch_builder_building", self.on_building)
-        self.event_bus.subscribe("batch_builder_idle", self.on_idle)
+        self.event_bus.subscribe("batch_builder_building", self.on_building, key=self.id)
+        self.event_bus.subscribe("batch_builder_idle", self.on_idle, key=self.id)
 
-    def on_building(self, payload):
+    def on_building(self, event: ComponentStateChanged):
         """Switch to 'building' mode (active)."""
-        if payload.get("id") == self.id:
-            self.operating = True
-            self.color = QColor("#FFA500")  # orange = building
-            self.update()
+        self.operating = True
+        self.color = QColor("#FFA500")  # orange = building
+        self.update()
 
-    def on_idle(self, payload):
+    def on_idle(self, event: ComponentStateChanged):
         """Switch back to 'idle' mode."""
-        if payload.get("id") == self.id:
-            self.operating = False
-            self.color = QColor("#808080")  # gray = idle
-            self.update()
+        self.operating = False
+        self.color = QColor("#808080")  # gray = idle
+        self.update()
 
     def paint(self, painter, option, widget=None):
         # Fill
@@ -383,17 +364,17 @@ class BaseStockItem(BaseComponentItem):
         font.setPixelSize(optimal_size)
         return font
 
-    def update_order_count(self, payload):
+    def update_order_count(self, event: StockCount):
         """Updates the order count and schedules a repaint."""
-        order_count = payload["count"]
+        order_count = event.count
         if type(order_count) == int:  # Validate payload
             self.order_count = order_count
             self.update()
 
-    def update_stock_count(self, payload):
+    def update_stock_count(self, event: StockCount):
         """Updates the pallet count and schedules a repaint."""
-        stock_count = payload["count"]
-        fill_percentage = payload["fill"]
+        stock_count = event.count
+        fill_percentage = event.fill
         if type(stock_count) == int and type(fill_percentage) == int:  # Validate payload
             self.stock_count = stock_count
             self.fill_percentage = fill_percentage
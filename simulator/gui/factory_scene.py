@@ -129,6 +129,12 @@ class FactoryScene(QGraphicsScene):
         self.payload_items[payload_id] = payload_item
         self.addItem(payload_item)
 
+    def clear_payloads(self):
+        """Remove every payload item from the scene."""
+        for payload_item in self.payload_items.values():
+            self.removeItem(payload_item)
+        self.payload_items.clear()
+
     def delete_payload(self, payload_id: int):
         payload_item = self.payload_items.get(payload_id)
         if not payload_item:
@@ -1,7 +1,7 @@
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtWidgets import QMainWindow, QApplication, QToolBar, QSplitter, QLabel, QWidget, QSizePolicy, \
-    QPushButton
+    QPushButton, QLineEdit
 from simulator.gui.factory_scene import FactoryScene
 from simulator.gui.factory_view import FactoryView
 from simulator.gui.simulation_controller import SimulationController
@@ -14,8 +14,10 @@ class MainWindow(QMainWindow):
     """
 
     """
-    def __init__(self, factory: Factory, scene: FactoryScene, controller: SimulationController, db_manager):
+    def __init__(self, factory: Factory, scene: FactoryScene, controller: SimulationController, db_manager,
+                 read_only: bool = False):
         super().__init__()
+        self.read_only = read_only # Replaying a recorded run, orders cannot be placed
         self.setWindowTitle("Material Flow")
         self.controller = controller
 
@@ -89,15 +91,23 @@ class MainWindow(QMainWindow):
 
         toolbar.addSeparator()
 
-        # Place RefillOrder button
-        refill_order_action = QAction("Refill Order", self)
-        refill_order_action.triggered.connect(self.refill_order_dialog.show_dialog)
-        toolbar.addAction(refill_order_action)
-
-        # Place OpmOrder button
-        opm_order_action = QAction("OPM Order", self)
-        opm_order_action.triggered.connect(self.opm_order_dialog.show_dialog)
-        toolbar.addAction(opm_order_action)
+        if self.read_only:
+            # Seek control for replays
+            self.seek_input = QLineEdit()
+            self.seek_input.setPlaceholderText("Seek to time")
+            self.seek_input.setFixedWidth(100)
+            self.seek_input.returnPressed.connect(self._on_seek)
+            toolbar.addWidget(self.seek_input)
+        else:
+            # Place RefillOrder button
+            refill_order_action = QAction("Refill Order", self)
+            refill_order_action.triggered.connect(self.refill_order_dialog.show_dialog)
+            toolbar.addAction(refill_order_action)
+
+            # Place OpmOrder button
+            opm_order_action = QAction("OPM Order", self)
+            opm_order_action.triggered.connect(self.opm_order_dialog.show_dialog)
+            toolbar.addAction(opm_order_action)
 
         # View Log button
         log_action = QAction("View Log", self)
@@ -116,6 +126,14 @@ class MainWindow(QMainWindow):
         self.dashboard_button.toggled.connect(self.toggle_dashboard)
         toolbar.addWidget(self.dashboard_button)
 
+    def _on_seek(self):
+        try:
+            sim_time = float(self.seek_input.text())
+        except ValueError:
+            return
+        self.controller.seek(sim_time)
+        self.seek_input.clear()
+
     def update_simulation_time(self, time: int):
         """
         Slot to update the simulation time label.
@@ -3,6 +3,9 @@ import simpy
 import time
 from simulator.gui.factory_scene import FactoryScene
 from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.event_log import EventReplayer
+from simulator.core.utils.events import PayloadCreated, PayloadMoved, PayloadStored, PayloadUpdated, SimulationStopped, \
+    ReplayReset
 
 
 class SimulationController(QObject):
@@ -13,7 +16,7 @@ class SimulationController(QObject):
     time_changed = pyqtSignal(int)
     speed_changed = pyqtSignal(float)
 
-    def __init__(self, env: simpy.Environment, scene: FactoryScene):
+    def __init__(self, env: simpy.Environment | EventReplayer, scene: FactoryScene):
         super().__init__()
         self.env = env
         self.scene = scene
@@ -39,6 +42,7 @@ class SimulationController(QObject):
         self.event_bus.subscribe("move_payload", self.on_move_payload)
         self.event_bus.subscribe("update_payload", self.on_update_payload_state)
         self.event_bus.subscribe("create_batch", self.on_create_batch)
+        self.event_bus.subscribe("replay_reset", self.on_replay_reset)
 
     def start(self):
         if self.running:
@@ -51,6 +55,14 @@ class SimulationController(QObject):
     def stop(self):
         self.running = False
         self.timer.stop()
+        self.event_bus.emit("simulation_stopped", SimulationStopped(sim_time=self.env.now))
+
+    def seek(self, sim_time: float):
+        """Jump to the given sim time. Only supported when replaying a recorded run."""
+        if not isinstance(self.env, EventReplayer):
+            return
+        self.env.seek(sim_time)
+        self.time_changed.emit(int(self.env.now))
 
     def change_speed(self):
         """Cycles to the next speed."""
@@ -97,24 +109,20 @@ class SimulationController(QObject):
     # Event handlers
     # --------------
 
-    def on_dispatch_pallet(self, data):
-        pallet_id = data["id"]
-        self.scene.create_payload(pallet_id, payload_type="SystemPallet")
+    def on_dispatch_pallet(self, event: PayloadCreated):
+        self.scene.create_payload(event.id, payload_type="SystemPallet")
+
+    def on_store_payload(self, event: PayloadStored):
+        self.scene.delete_payload(event.id)
 
-    def on_store_payload(self, data):
-        pallet_id = data["id"]
-        self.scene.delete_payload(pallet_id)
+    def on_move_payload(self, event: PayloadMoved):
+        self.scene.update_payload_position(event.id, event.coords)
 
-    def on_move_payload(self, data):
-        payload_id = data["id"]
-        new_pos = data["coords"]
-        self.scene.update_payload_position(payload_id, new_pos)
+    def on_update_payload_state(self, event: PayloadUpdated):
+        self.scene.update_payload_state(event.id, event.state)
 
-    def on_update_payload_state(self, data):
-        payload_id = data["id"]
-        new_state = data["state"]
-        self.scene.update_payload_state(payload_id, new_state)
+    def on_create_batch(self, event: PayloadCreated):
+        self.scene.create_payload(event.id, payload_type="ItemBatch")
 
-    def on_create_batch(self, data):
-        batch_id = data["id"]
-        self.scene.create_payload(batch_id, payload_type="ItemBatch")
\ No newline at end of file
+    def on_replay_reset(self, event: ReplayReset):
+        self.scene.clear_payloads()
\ No newline at end of file
@@ -0,0 +1,218 @@
+import time
+from dataclasses import dataclass, asdict, replace
+import simpy
+from simulator.core.factory.factory import Factory
+from simulator.core.orders.order import OrderStatus
+from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import OrderCreated, OrderUpdated, PayloadCreated, PayloadStored
+from simulator.core.utils.event_log import EventRecorder
+from simulator.core.utils.id_gen_config import id_generator
+from simulator.core.utils.logging_config import log_manager
+from simulator.database.database_listener import DatabaseListener
+from simulator.database.database_manager import DatabaseManager
+from simulator.database.background_writer import BackgroundWriter
+from simulator.config import ITEM_JSON, FACTORY_JSON
+import logging
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HeadlessResult:
+    """
+    KPIs of a headless simulation run.
+
+    Attributes
+    ----------
+    sim_time : float
+        Simulation time at the end of the run.
+    wall_time : float
+        Real time in seconds spent advancing the simulation.
+    events_processed : int
+        Amount of SimPy events processed during the run.
+    orders_created : int
+        Orders placed in the warehouses.
+    orders_completed : int
+        Orders that reached COMPLETED status.
+    pallets_dispatched : int
+        Pallets taken out of the warehouse for orders.
+    payloads_stored : int
+        Payloads (pallets and batches) stored back to stock.
+    batches_created : int
+        Item batches built on batch builders.
+    """
+    sim_time: float = 0.0
+    wall_time: float = 0.0
+    events_processed: int = 0
+    orders_created: int = 0
+    orders_completed: int = 0
+    pallets_dispatched: int = 0
+    payloads_stored: int = 0
+    batches_created: int = 0
+
+    @property
+    def speedup(self) -> float:
+        """Simulated seconds per real second."""
+        if self.wall_time <= 0:
+            return float('inf')
+        return self.sim_time / self.wall_time
+
+    @property
+    def throughput(self) -> float:
+        """Completed orders per simulated hour."""
+        if self.sim_time <= 0:
+            return 0.0
+        return self.orders_completed * 3600 / self.sim_time
+
+    def as_dict(self) -> dict:
+        result = asdict(self)
+        result["speedup"] = self.speedup
+        result["throughput"] = self.throughput
+        return result
+
+
+class HeadlessSimulation:
+    """
+    Composition root for running the simulation without the GUI.
+    Builds the factory and runs the environment as fast as the CPU allows.
+
+    Attributes
+    ----------
+    env : simpy.Environment
+        The simulation environment.
+    event_bus : EventBus
+        Event bus shared by the factory and the optional database listener.
+    factory : Factory
+        The simulated factory.
+    inventory_manager : InventoryManager
+        Interface for placing orders.
+    db_manager : DatabaseManager
+        Database persistence. Value is 'None' if the run is not persisted.
+    db_writer : BackgroundWriter
+        Writer thread persisting the run. Value is 'None' if persisting on the simulation thread.
+    recorder : EventRecorder
+        Records every event of the run for replay. Value is 'None' if the run is not recorded.
+    seed : int
+        Seed for the run's random number generation. Value is 'None' for a random seed.
+    """
+    def __init__(self, items_json_name: str = ITEM_JSON,
+                 layout_json_name: str = FACTORY_JSON,
+                 db_url: str | None = None,
+                 seed: int | None = None,
+                 background_writer: bool = False,
+                 record_path: str | None = None):
+        # The id generator and log manager are process-wide singletons,
+        # reset them so that every run starts from a clean state
+        self.seed = seed
+        id_generator.reset(seed)
+        log_manager.clear()
+
+        self.env = simpy.Environment()
+        self.event_bus = EventBus()
+        self._result = HeadlessResult()
+        self._setup_kpi_subscriptions()
+
+        # Attach the recorder before the factory is built so setup events are captured too
+        self.recorder: EventRecorder | None = None
+        if record_path is not None:
+            self.recorder = EventRecorder(self.env, self.event_bus, record_path)
+
+        # Persistence is optional for headless runs
+        self.db_manager: DatabaseManager | None = None
+        self.db_writer: BackgroundWriter | None = None
+        if db_url is not None:
+            self.db_manager = DatabaseManager(db_url)
+            self.db_manager.setup_database(fresh_start=True)
+            if background_writer:
+                self.db_writer = BackgroundWriter(db_url)
+                self.db_writer.setup_subscriptions(self.event_bus, self.db_manager)
+            else:
+                self.db_listener = DatabaseListener(self.event_bus, self.db_manager)
+                self.db_listener.setup_subscriptions()
+
+        self.factory = Factory(self.env, self.event_bus,
+                               items_json_name=items_json_name,
+                               layout_json_name=layout_json_name)
+        self.factory.init_simulation()
+        self.inventory_manager = self.factory.inventory_manager
+
+    # ---------------
+    # KPI collection
+    # ---------------
+
+    def _setup_kpi_subscriptions(self):
+        self.event_bus.subscribe("create_order", self._on_order_created)
+        self.event_bus.subscribe("update_order", self._on_order_updated)
+        self.event_bus.subscribe("dispatch_pallet", self._on_pallet_dispatched)
+        self.event_bus.subscribe("store_payload", self._on_payload_stored)
+        self.event_bus.subscribe("create_batch", self._on_batch_created)
+
+    def _on_order_created(self, event: OrderCreated):
+        self._result.orders_created += 1
+
+    def _on_order_updated(self, event: OrderUpdated):
+        if event.status == OrderStatus.COMPLETED:
+            self._result.orders_completed += 1
+
+    def _on_pallet_dispatched(self, event: PayloadCreated):
+        self._result.pallets_dispatched += 1
+
+    def _on_payload_stored(self, event: PayloadStored):
+        self._result.payloads_stored += 1
+
+    def _on_batch_created(self, event: PayloadCreated):
+        self._result.batches_created += 1
+
+    # ---------------
+    # Order placing
+    # ---------------
+
+    def schedule_refill_order(self, at: float, item_id: int, qty: int):
+        """Place a refill order at the given sim time."""
+        self.env.process(self._place_at(at, self.inventory_manager.place_refill_order, item_id, qty))
+
+    def schedule_opm_order(self, at: float, items: dict[int, int]):
+        """Place an opm order at the given sim time."""
+        self.env.process(self._place_at(at, self.inventory_manager.place_opm_order, items))
+
+    def _place_at(self, at: float, place, *args):
+        yield self.env.timeout(max(0.0, at - self.env.now))
+        place(*args)
+
+    # -------
+    #  Run
+    # -------
+
+    def run(self, until: float) -> HeadlessResult:
+        """
+        Advance the simulation until the given sim time without real-time pacing.
+        Can be called repeatedly to continue the same run. Return accumulated KPIs.
+        """
+        if until <= self.env.now:
+            raise ValueError(f"until ({until}) must be greater than the current sim time ({self.env.now})")
+
+        logger.info(f"Running headless simulation from {self.env.now} to {until}.")
+        env = self.env
+        events = 0
+        start = time.perf_counter()
+        while env.peek() < until:
+            env.step()
+            events += 1
+        env.run(until=until) # Move the clock to the end of the run
+        if self.recorder is not None:
+            self.recorder.flush()
+        if self.db_writer is not None:
+            self.db_writer.flush()
+        elif self.db_manager is not None:
+            self.db_listener.flush()
+        self._result.wall_time += time.perf_counter() - start
+
+        self._result.events_processed += events
+        self._result.sim_time = env.now
+        return replace(self._result)
+
+    def close(self):
+        """Release the database writer thread and the recorder, if any."""
+        if self.db_writer is not None:
+            self.db_writer.close()
+        if self.recorder is not None:
+            self.recorder.close()
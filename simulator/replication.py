@@ -0,0 +1,137 @@
+import math
+import random
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+from simulator.headless import HeadlessSimulation, HeadlessResult
+from simulator.config import ITEM_JSON, FACTORY_JSON
+
+# Two-sided 95% t-distribution quantiles keyed by degrees of freedom
+_T_975 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+          9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145, 15: 2.131,
+          16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086, 25: 2.060, 30: 2.042}
+
+
+@dataclass
+class OrderMix:
+    """
+    Random order stream placed during a replication.
+    Order times are drawn uniformly over the horizon, items and quantities uniformly from the catalogue.
+
+    Attributes
+    ----------
+    refill_orders : int
+        Amount of refill orders to place.
+    opm_orders : int
+        Amount of opm orders to place.
+    max_qty : int
+        Max quantity per order line.
+    max_lines : int
+        Max amount of different items in an opm order.
+    horizon : float
+        Orders are placed within [0, horizon). Value is 'None' to use the whole run.
+    """
+    refill_orders: int = 10
+    opm_orders: int = 0
+    max_qty: int = 200
+    max_lines: int = 3
+    horizon: float | None = None
+
+    def schedule(self, simulation: HeadlessSimulation, rng: random.Random, until: float):
+        """Schedule the random orders on the given simulation."""
+        item_ids = simulation.factory.catalogue.item_ids()
+        horizon = self.horizon if self.horizon is not None else until
+
+        for _ in range(self.refill_orders):
+            simulation.schedule_refill_order(at=rng.uniform(0, horizon),
+                                             item_id=rng.choice(item_ids),
+                                             qty=rng.randint(1, self.max_qty))
+
+        for _ in range(self.opm_orders):
+            lines = rng.sample(item_ids, k=rng.randint(1, min(self.max_lines, len(item_ids))))
+            simulation.schedule_opm_order(at=rng.uniform(0, horizon),
+                                          items={item_id: rng.randint(1, self.max_qty) for item_id in lines})
+
+
+@dataclass
+class KpiSummary:
+    """Summary statistics of one KPI over all replications."""
+    mean: float
+    stdev: float
+    ci95_low: float
+    ci95_high: float
+    min: float
+    max: float
+
+
+@dataclass
+class ReplicationSummary:
+    """
+    Results of a replication study.
+
+    Attributes
+    ----------
+    seeds : list[int]
+        Seeds of the runs, in the same order as runs.
+    runs : list[HeadlessResult]
+        Per-run KPIs.
+    kpis : dict[str, KpiSummary]
+        Summary statistics keyed by KPI name.
+    """
+    seeds: list[int] = field(default_factory=list)
+    runs: list[HeadlessResult] = field(default_factory=list)
+    kpis: dict[str, KpiSummary] = field(default_factory=dict)
+
+
+def run_replication(seed: int, until: float,
+                    order_mix: OrderMix | None = None,
+                    items_json_name: str = ITEM_JSON,
+                    layout_json_name: str = FACTORY_JSON) -> HeadlessResult:
+    """Run one isolated replication. Module-level so it can be sent to worker processes."""
+    simulation = HeadlessSimulation(items_json_name=items_json_name,
+                                    layout_json_name=layout_json_name,
+                                    seed=seed)
+    if order_mix is not None:
+        order_mix.schedule(simulation, random.Random(seed), until)
+    return simulation.run(until=until)
+
+
+def summarize(seeds: list[int], runs: list[HeadlessResult]) -> ReplicationSummary:
+    """Merge per-run KPIs into summary statistics."""
+    summary = ReplicationSummary(seeds=list(seeds), runs=list(runs))
+    if not runs:
+        return summary
+
+    n = len(runs)
+    t_value = _T_975.get(n - 1) or (_T_975[max(k for k in _T_975 if k <= n - 1)] if n <= 31 else 1.96)
+    for name in runs[0].as_dict():
+        values = [run.as_dict()[name] for run in runs]
+        if any(math.isinf(value) for value in values):
+            continue
+        mean = statistics.fmean(values)
+        stdev = statistics.stdev(values) if n > 1 else 0.0
+        half_width = t_value * stdev / math.sqrt(n) if n > 1 else 0.0
+        summary.kpis[name] = KpiSummary(mean=mean, stdev=stdev,
+                                        ci95_low=mean - half_width, ci95_high=mean + half_width,
+                                        min=min(values), max=max(values))
+    return summary
+
+
+def run_replications(seeds: Iterable[int], until: float,
+                     order_mix: OrderMix | None = None,
+                     max_workers: int | None = None,
+                     items_json_name: str = ITEM_JSON,
+                     layout_json_name: str = FACTORY_JSON) -> ReplicationSummary:
+    """
+    Run one independent replication per seed across a process pool and summarize the KPIs.
+    Every replication builds its own environment and factory and resets the process-wide
+    id generator and log manager, so runs sharing a worker process do not affect each other.
+    """
+    seeds = list(seeds)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(run_replication, seed, until, order_mix,
+                                   items_json_name, layout_json_name)
+                   for seed in seeds]
+        runs = [future.result() for future in futures]
+    return summarize(seeds, runs)
@@ -124,4 +124,16 @@ def test_update_order(db_manager):
     with db_manager.Session() as session:
         order = session.get(Order, 5001)
         assert order is not None
-        assert order.status == OrderStatus.IN_PROGRESS
\ No newline at end of file
+        assert order.status == OrderStatus.IN_PROGRESS
+def test_performance_profile_and_indexes(db_manager):
+    """Tests that the connection pragmas are applied and the query indexes are created."""
+    with db_manager.engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert connection.exec_driver_sql("PRAGMA synchronous").scalar() == 1 # NORMAL
+
+    inspector = inspect(db_manager.engine)
+    order_indexes = {tuple(index["column_names"]) for index in inspector.get_indexes("orders")}
+    assert ("status", "order_time") in order_indexes
+    assert ("type",) in order_indexes
+    pallet_indexes = {tuple(index["column_names"]) for index in inspector.get_indexes("pallets")}
+    assert ("stored", "last_updated_sim_time") in pallet_indexes
@@ -0,0 +1,97 @@
+from sqlalchemy import event
+from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import PalletCreated, PayloadMoved, OrderCreated, OrderUpdated, SimulationStopped
+from simulator.database.database_listener import DatabaseListener
+from simulator.database.models import Pallet, RefillOrder, OrderStatus
+from simulator.headless import HeadlessSimulation
+
+
+def _listener(db_manager, **kwargs) -> tuple[EventBus, DatabaseListener]:
+    bus = EventBus()
+    listener = DatabaseListener(bus, db_manager, **kwargs)
+    listener.setup_subscriptions()
+    return bus, listener
+
+
+def _moved(pallet_id: int, location: str, sim_time: float) -> PayloadMoved:
+    return PayloadMoved(id=pallet_id, type="SystemPallet", location=location,
+                        sim_time=sim_time, coords=(0, 0), component_id="C")
+
+
+def _count_commits(db_manager) -> list:
+    commits = []
+    event.listen(db_manager.engine, "commit", lambda conn: commits.append(conn))
+    return commits
+
+
+def test_pallet_moves_are_coalesced(db_manager):
+    """Repeated updates to one pallet within a window end up as a single row write."""
+    bus, listener = _listener(db_manager, batch_size=1000, sim_interval=1000)
+    commits = _count_commits(db_manager)
+
+    bus.emit("create_pallet", PalletCreated(pallet_id=1, location="WH", sim_time=0.0))
+    for step in range(50):
+        bus.emit("move_payload", _moved(1, f"C{step}", float(step)))
+    assert listener.pending == 51
+    assert commits == []
+
+    listener.flush()
+    assert len(commits) == 1
+    assert listener.pending == 0
+
+    with db_manager.Session() as session:
+        pallet = session.get(Pallet, 1)
+        assert pallet.location == "C49"
+        assert pallet.last_updated_sim_time == 49.0
+
+
+def test_flush_on_batch_size_and_sim_window(db_manager):
+    bus, listener = _listener(db_manager, batch_size=3, sim_interval=10.0)
+    commits = _count_commits(db_manager)
+
+    bus.emit("create_pallet", PalletCreated(pallet_id=1, location="WH", sim_time=0.0))
+    bus.emit("create_pallet", PalletCreated(pallet_id=2, location="WH", sim_time=0.0))
+    assert commits == []
+    bus.emit("create_pallet", PalletCreated(pallet_id=3, location="WH", sim_time=0.0))
+    assert len(commits) == 1 # Batch size reached
+
+    bus.emit("move_payload", _moved(1, "A", 1.0))
+    bus.emit("move_payload", _moved(1, "B", 11.0))
+    assert len(commits) == 2 # Sim time window passed
+
+    with db_manager.Session() as session:
+        assert session.get(Pallet, 1).location == "B"
+        assert session.query(Pallet).count() == 3
+
+
+def test_query_and_stop_flush_buffer(db_manager):
+    bus, listener = _listener(db_manager)
+    db_manager.insert_item(item_id=202, name="Refill Item", weight=1,
+                           category="Supplies", volume=1, stackable=False)
+
+    bus.emit("create_order", OrderCreated(order_id=5, order_time=1.0, type="RefillOrder",
+                                          item_id=202, qty=10))
+    bus.emit("update_order", OrderUpdated(order_id=5, status=OrderStatus.IN_PROGRESS))
+    orders = db_manager.query_orders()
+    assert [order.id for order in orders] == [5]
+    assert orders[0].status == OrderStatus.IN_PROGRESS
+
+    bus.emit("update_order", OrderUpdated(order_id=5, status=OrderStatus.COMPLETED, completion_time=9.0))
+    bus.emit("simulation_stopped", SimulationStopped(sim_time=9.0))
+    assert listener.pending == 0
+    with db_manager.Session() as session:
+        order = session.get(RefillOrder, 5)
+        assert order.status == OrderStatus.COMPLETED
+        assert order.completion_time == 9.0
+
+
+def test_headless_run_persists_state(tmp_path):
+    simulation = HeadlessSimulation(db_url=f"sqlite:///{tmp_path / 'run.db'}")
+    simulation.inventory_manager.place_refill_order(1001, 50)
+    simulation.run(until=300)
+
+    assert simulation.db_listener.pending == 0
+    orders = simulation.db_manager.query_orders()
+    assert len(orders) >= 1
+    moved = simulation.db_manager.query_pallets(stored=False)
+    assert all(pallet.last_updated_sim_time <= 300 for pallet in moved)
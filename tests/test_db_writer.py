@@ -0,0 +1,70 @@
+import threading
+import pytest
+from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import PalletCreated, PayloadMoved
+from simulator.database.background_writer import BackgroundWriter
+from simulator.database.database_manager import DatabaseManager
+from simulator.database.models import Pallet
+from simulator.headless import HeadlessSimulation
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'writer.db'}"
+    DatabaseManager(url).setup_database(fresh_start=True)
+    return url
+
+
+def test_writer_persists_off_thread(db_url):
+    reader = DatabaseManager(db_url)
+    writer = BackgroundWriter(db_url)
+    bus = EventBus()
+    writer.setup_subscriptions(bus, reader)
+
+    seen_threads = set()
+    original_write = writer.db_manager.write_batch
+    def tracking_write(**kwargs):
+        seen_threads.add(threading.current_thread().name)
+        original_write(**kwargs)
+    writer.db_manager.write_batch = tracking_write
+
+    bus.emit("create_pallet", PalletCreated(pallet_id=1, location="WH", sim_time=0.0))
+    bus.emit("move_payload", PayloadMoved(id=1, type="SystemPallet", location="C1",
+                                          sim_time=3.0, coords=(0, 0), component_id="C"))
+
+    pallets = reader.query_pallets() # Flush hook waits for the writer
+    assert [(p.id, p.location) for p in pallets] == [(1, "C1")]
+    assert seen_threads == {"db-writer"}
+    writer.close()
+    assert not writer.is_alive
+
+
+def test_writer_backpressure_and_shutdown(db_url):
+    writer = BackgroundWriter(db_url, maxsize=2, batch_size=1000, sim_interval=1000)
+    for pallet_id in range(200):
+        writer.submit("create_pallet", PalletCreated(pallet_id=pallet_id, location="WH", sim_time=0.0))
+        assert writer.queued <= 2
+    writer.close()
+
+    with DatabaseManager(db_url).Session() as session:
+        assert session.query(Pallet).count() == 200
+    writer.submit("create_pallet", PalletCreated(pallet_id=999, location="WH", sim_time=0.0)) # Ignored once closed
+
+
+def test_writer_requires_file_database():
+    with pytest.raises(ValueError):
+        BackgroundWriter("sqlite:///:memory:")
+
+
+def test_headless_background_writer_matches_inline(tmp_path):
+    def persisted_orders(background_writer: bool, name: str):
+        simulation = HeadlessSimulation(db_url=f"sqlite:///{tmp_path / name}",
+                                        background_writer=background_writer, seed=3)
+        simulation.inventory_manager.place_refill_order(1001, 50)
+        simulation.run(until=600)
+        orders = [(order.id, order.status) for order in simulation.db_manager.query_orders()]
+        pallets = [(p.id, p.location, p.stored) for p in simulation.db_manager.query_pallets()]
+        simulation.close()
+        return orders, pallets
+
+    assert persisted_orders(True, "thread.db") == persisted_orders(False, "inline.db")
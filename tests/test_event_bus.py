@@ -0,0 +1,48 @@
+from simulator.core.utils.event_bus import EventBus
+from simulator.core.utils.events import ComponentStateChanged, StockCount
+
+
+def test_keyed_subscribers_only_receive_their_key():
+    bus = EventBus()
+    received = {"D1": [], "D2": [], "all": []}
+    bus.subscribe("depalletizer_operating", received["D1"].append, key="D1")
+    bus.subscribe("depalletizer_operating", received["D2"].append, key="D2")
+    bus.subscribe("depalletizer_operating", received["all"].append)
+
+    event = ComponentStateChanged(id="D1")
+    bus.emit("depalletizer_operating", event, key="D1")
+
+    assert received["D1"] == [event]
+    assert received["D2"] == []
+    assert received["all"] == [event]
+
+
+def test_unkeyed_emit_skips_keyed_subscribers():
+    bus = EventBus()
+    keyed, topic = [], []
+    bus.subscribe("warehouse_order_count", keyed.append, key="warehouse")
+    bus.subscribe("warehouse_order_count", topic.append)
+
+    bus.emit("warehouse_order_count", StockCount(count=3))
+    assert keyed == []
+    assert topic == [StockCount(count=3)]
+
+
+def test_unsubscribe_and_has_subscribers():
+    bus = EventBus()
+    received = []
+    assert not bus.has_subscribers("move_payload")
+
+    bus.subscribe("move_payload", received.append, key="C1")
+    assert bus.has_subscribers("move_payload", key="C1")
+    assert not bus.has_subscribers("move_payload", key="C2")
+
+    bus.unsubscribe("move_payload", received.append, key="C1")
+    assert not bus.has_subscribers("move_payload", key="C1")
+    bus.emit("move_payload", None, key="C1")
+    assert received == []
+
+
+def test_events_are_slotted():
+    event = StockCount(count=1, fill=10)
+    assert not hasattr(event, "__dict__")
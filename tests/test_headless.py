@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from simulator.headless import HeadlessSimulation
+
+
+def test_headless_run_kpis():
+    """Run the default layout headless with one refill order and check the KPIs."""
+    simulation = HeadlessSimulation()
+    simulation.inventory_manager.place_refill_order(item_id=1001, qty_requested=30)
+    result = simulation.run(until=1000)
+
+    assert result.sim_time == 1000
+    assert result.events_processed > 0
+    assert result.orders_created == 1
+    assert result.orders_completed == 1
+    assert result.pallets_dispatched == 1
+    assert result.batches_created > 0
+
+def test_headless_continue_run():
+    """Runs can be continued and KPIs accumulate."""
+    simulation = HeadlessSimulation()
+    simulation.schedule_refill_order(at=50, item_id=1001, qty=10)
+    first = simulation.run(until=40)
+    assert first.orders_created == 0
+
+    second = simulation.run(until=500)
+    assert second.sim_time == 500
+    assert second.orders_created == 1
+    assert second.events_processed > first.events_processed
+
+    with pytest.raises(ValueError):
+        simulation.run(until=100)
+
+def test_headless_without_gui_stack():
+    """Importing and running headless must not load PyQt6."""
+    code = ("import sys\n"
+            "from simulator.headless import HeadlessSimulation\n"
+            "HeadlessSimulation().run(until=10)\n"
+            "sys.exit(int('PyQt6' in sys.modules))\n")
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                               cwd=Path(__file__).parent.parent)
+    assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,33 @@
+from simulator.replication import OrderMix, run_replication, run_replications, summarize
+
+MIX = OrderMix(refill_orders=4, opm_orders=0, max_qty=100, horizon=200)
+
+
+def test_same_seed_is_reproducible():
+    first = run_replication(seed=7, until=1500, order_mix=MIX)
+    second = run_replication(seed=7, until=1500, order_mix=MIX)
+
+    assert first.orders_created == MIX.refill_orders
+    for key in ("orders_created", "orders_completed", "pallets_dispatched",
+                "payloads_stored", "batches_created", "events_processed"):
+        assert getattr(first, key) == getattr(second, key)
+
+
+def test_summarize_statistics():
+    runs = [run_replication(seed=seed, until=1500, order_mix=MIX) for seed in (1, 2, 3)]
+    summary = summarize([1, 2, 3], runs)
+
+    kpi = summary.kpis["orders_created"]
+    assert kpi.mean == MIX.refill_orders
+    assert kpi.stdev == 0.0
+    assert kpi.ci95_low == kpi.ci95_high == kpi.mean
+    throughput = summary.kpis["throughput"]
+    assert throughput.ci95_low <= throughput.mean <= throughput.ci95_high
+
+
+def test_run_replications_process_pool():
+    summary = run_replications(seeds=[11, 12], until=500, order_mix=MIX, max_workers=2)
+
+    assert summary.seeds == [11, 12]
+    assert len(summary.runs) == 2
+    assert summary.kpis["sim_time"].mean == 500